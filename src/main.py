@@ -1,15 +1,208 @@
 import sys
 import os
+import queue
+import functools
+import subprocess
+import string
+from datetime import datetime
+from collections import deque
+from types import MappingProxyType
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                             QLabel, QPushButton, QFileDialog, QSpinBox, QComboBox, 
-                            QProgressBar, QTextEdit, QLineEdit, QTabWidget, QCheckBox,
-                            QGroupBox, QFormLayout, QMessageBox, QSplitter, QFrame,
-                            QScrollArea, QToolButton, QAction, QMenu, QStyle)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QSettings, QSize, QEvent
-from PyQt5.QtGui import QIcon, QFont, QPalette, QColor, QPixmap, QCursor, QFontDatabase
+                            QProgressBar, QTextEdit, QLineEdit, QCheckBox,
+                            QGroupBox, QFormLayout, QGridLayout, QMessageBox, QFrame,
+                            QScrollArea, QStyle, QSystemTrayIcon)
+from PyQt5.QtCore import (Qt, QObject, QThread, QThreadPool, QRunnable, QSettings,
+                          QTimer, pyqtSignal)
+from PyQt5.QtGui import QFont, QPalette, QColor, QCursor, QTextCursor
 
-from pdf_processor import PDFProcessor
-from settings import SettingsDialog
+# pdf_processor (PyMuPDF, requests), fitz and settings are imported lazily
+# where they are used to keep application start-up fast
+from rate_limiter import TokenBucket
+from ocr_cache import OCRCache
+
+# UI strings for each supported language, looked up by a stable key
+I18N = {
+    "English": {
+        "window_title": "PageWisePDF - PDF OCR and Processing Tool",
+        "app_subtitle": "AI-Powered PDF Processing",
+        "pdf_selection": "PDF Selection",
+        "select_pdf_placeholder": "Select a PDF file...",
+        "browse": "Browse",
+        "output_directory": "Output Directory",
+        "select_output_placeholder": "Select output directory...",
+        "processing_options": "Processing Options",
+        "full_text_extraction": "Full Text Extraction",
+        "summary_mode": "Summary Mode",
+        "mode_label": "Mode:",
+        "output_language_label": "Output Language:",
+        "process_all_pages": "Process all pages",
+        "from_label": "From:",
+        "to_label": "To:",
+        "page_range_label": "Page Range:",
+        "force_refresh": "Force refresh (ignore cached results)",
+        "cache_label": "Cache:",
+        "show_completion_popup": "Show completion popup",
+        "notifications_label": "Notifications:",
+        "api_settings": "API Settings",
+        "clear_cache": "Clear Cache",
+        "progress": "Progress",
+        "ready": "Ready",
+        "log": "Log",
+        "clear_log": "Clear Log",
+        "start_processing": "Start Processing",
+        "cancel": "Cancel",
+        "language_changed": "Language changed to English",
+        "log_cleared": "Log cleared",
+        "cache_cleared": "Cleared {count} cached result(s)",
+        "cache_clear_error": "Error clearing cache: {error}",
+        "pdf_file_filter": "PDF Files (*.pdf)",
+        "select_pdf_title": "Select PDF File",
+        "selected_file": "Selected file: {filename}",
+        "counting_pages": "Counting pages...",
+        "pdf_page_count": "PDF has {count} pages",
+        "pdf_read_error": "Error reading PDF: {error}",
+        "select_output_title": "Select Output Directory",
+        "output_directory_selected": "Output directory: {path}",
+        "settings_updated": "Settings updated",
+        "invalid_pdf_title": "Invalid PDF",
+        "invalid_pdf_message": "Please select a valid PDF file.",
+        "invalid_output_title": "Invalid Output Directory",
+        "invalid_output_message": "Please select a valid output directory.",
+        "api_key_required_title": "API Key Required",
+        "api_key_required_message": "Please enter your OpenAI API key in settings.",
+        "mode_summary": "summary",
+        "mode_ocr": "OCR",
+        "starting_processing": "Starting {mode} processing with {model}...",
+        "processing_pdf": "Processing PDF...",
+        "cancelling_processing": "Cancelling processing...",
+        "cancelling": "Cancelling...",
+        "processing_cancelled": "Processing cancelled",
+        "processing_completed": "Processing completed",
+        "processing_complete_title": "Processing Complete",
+        "processing_complete_message": "PDF processing completed successfully!\nOutput saved to: {path}",
+        "open_folder": "Open Folder",
+    },
+    "Chinese": {
+        "window_title": "PageWisePDF - PDF OCR 和处理工具",
+        "app_subtitle": "AI驱动的PDF处理工具",
+        "pdf_selection": "PDF 选择",
+        "select_pdf_placeholder": "选择 PDF 文件...",
+        "browse": "浏览",
+        "output_directory": "输出目录",
+        "select_output_placeholder": "选择输出目录...",
+        "processing_options": "处理选项",
+        "full_text_extraction": "完整文本提取",
+        "summary_mode": "摘要模式",
+        "mode_label": "模式:",
+        "output_language_label": "输出语言:",
+        "process_all_pages": "处理所有页面",
+        "from_label": "从:",
+        "to_label": "到:",
+        "page_range_label": "页面范围:",
+        "force_refresh": "强制刷新（忽略缓存结果）",
+        "cache_label": "缓存:",
+        "show_completion_popup": "完成后显示弹窗",
+        "notifications_label": "通知:",
+        "api_settings": "API 设置",
+        "clear_cache": "清除缓存",
+        "progress": "进度",
+        "ready": "就绪",
+        "log": "日志",
+        "clear_log": "清除日志",
+        "start_processing": "开始处理",
+        "cancel": "取消",
+        "language_changed": "语言已更改为中文",
+        "log_cleared": "日志已清除",
+        "cache_cleared": "已清除 {count} 条缓存结果",
+        "cache_clear_error": "清除缓存时出错: {error}",
+        "pdf_file_filter": "PDF 文件 (*.pdf)",
+        "select_pdf_title": "选择 PDF 文件",
+        "selected_file": "已选择文件: {filename}",
+        "counting_pages": "正在统计页数...",
+        "pdf_page_count": "PDF 有 {count} 页",
+        "pdf_read_error": "读取 PDF 时出错: {error}",
+        "select_output_title": "选择输出目录",
+        "output_directory_selected": "输出目录: {path}",
+        "settings_updated": "设置已更新",
+        "invalid_pdf_title": "无效的 PDF",
+        "invalid_pdf_message": "请选择有效的 PDF 文件。",
+        "invalid_output_title": "无效的输出目录",
+        "invalid_output_message": "请选择有效的输出目录。",
+        "api_key_required_title": "需要 API 密钥",
+        "api_key_required_message": "请在设置中输入您的 OpenAI API 密钥。",
+        "mode_summary": "摘要",
+        "mode_ocr": "OCR",
+        "starting_processing": "开始使用 {model} 进行{mode}处理...",
+        "processing_pdf": "正在处理 PDF...",
+        "cancelling_processing": "正在取消处理...",
+        "cancelling": "正在取消...",
+        "processing_cancelled": "处理已取消",
+        "processing_completed": "处理完成",
+        "processing_complete_title": "处理完成",
+        "processing_complete_message": "PDF 处理成功完成！\n输出已保存到: {path}",
+        "open_folder": "打开文件夹",
+    },
+}
+
+# Freeze the tables and intern their keys so lookups hit the fast dict path
+I18N = MappingProxyType({
+    language: MappingProxyType({sys.intern(key): text for key, text in strings.items()})
+    for language, strings in I18N.items()
+})
+
+# Lines kept in the log view; older ones are evicted as new ones arrive
+LOG_MAX_LINES = 5000
+
+# Processor log lines waiting for the GUI, and how many are shown per drain tick
+LOG_QUEUE_SIZE = 1000
+LOG_DRAIN_BATCH = 200
+
+# MainWindow attributes persisted in the "main" settings group under the same names
+SETTINGS_KEYS = (
+    "api_key", "api_endpoint", "model_name", "concurrent_calls", "pages_per_call",
+    "language", "requests_per_minute", "tokens_per_minute", "image_format",
+    "save_images", "save_page_markdown", "target_max_dim", "show_completion_popup",
+)
+
+# System file explorer launcher, resolved once for the running platform
+if sys.platform == 'win32':
+    open_in_file_manager = os.startfile
+else:
+    _FILE_MANAGER = 'open' if sys.platform == 'darwin' else 'xdg-open'  # macOS / Linux
+    
+    def open_in_file_manager(path):
+        """Open path with the desktop's file manager"""
+        subprocess.call([_FILE_MANAGER, path])
+
+# Translatable widget texts as (widget key, setter name, I18N key), applied by
+# MainWindow.retranslate_ui at start-up and whenever the language changes
+UI_TEXT_SPEC = [
+    ("file_group", "setTitle", "pdf_selection"),
+    ("file_path_edit", "setPlaceholderText", "select_pdf_placeholder"),
+    ("browse_button", "setText", "browse"),
+    ("output_group", "setTitle", "output_directory"),
+    ("output_path_edit", "setPlaceholderText", "select_output_placeholder"),
+    ("output_button", "setText", "browse"),
+    ("options_title", "setText", "processing_options"),
+    ("mode_label", "setText", "mode_label"),
+    ("output_language_label", "setText", "output_language_label"),
+    ("process_all_pages", "setText", "process_all_pages"),
+    ("from_label", "setText", "from_label"),
+    ("to_label", "setText", "to_label"),
+    ("page_range_label", "setText", "page_range_label"),
+    ("force_refresh_check", "setText", "force_refresh"),
+    ("cache_label", "setText", "cache_label"),
+    ("completion_popup_check", "setText", "show_completion_popup"),
+    ("notifications_label", "setText", "notifications_label"),
+    ("settings_button", "setText", "api_settings"),
+    ("clear_cache_button", "setText", "clear_cache"),
+    ("progress_group", "setTitle", "progress"),
+    ("log_group", "setTitle", "log"),
+    ("clear_log_button", "setText", "clear_log"),
+    ("start_button", "setText", "start_processing"),
+    ("cancel_button", "setText", "cancel"),
+]
 
 class ThemeColors:
     """Theme colors for the application"""
@@ -23,6 +216,237 @@ class ThemeColors:
     SUCCESS = QColor(46, 204, 113)
     WARNING = QColor(241, 196, 15)
     ERROR = QColor(231, 76, 60)
+    
+    # "#rrggbb" forms for stylesheets, formatted once
+    PRIMARY_HEX = PRIMARY.name()
+    SECONDARY_HEX = SECONDARY.name()
+    TEXT_HEX = TEXT.name()
+
+# Application-wide stylesheet, substituted from the theme colors and parsed
+# once. Styled* widgets are matched by class name (and StyledButton by its
+# "variant" property), other one-off widgets by object name, instead of each
+# parsing its own copy
+_APP_QSS_TEMPLATE = string.Template("""
+    QMainWindow {
+        background-color: #f8f9fa;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #f0f0f0;
+        width: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #c0c0c0;
+        min-height: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0px;
+    }
+    QScrollBar:horizontal {
+        border: none;
+        background: #f0f0f0;
+        height: 10px;
+        margin: 0px;
+    }
+    QScrollBar::handle:horizontal {
+        background: #c0c0c0;
+        min-width: 20px;
+        border-radius: 5px;
+    }
+    QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
+        width: 0px;
+    }
+    QToolTip {
+        border: 1px solid #ccc;
+        background-color: #f8f9fa;
+        color: #333;
+        padding: 5px;
+    }
+    StyledButton {
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    StyledButton[variant="primary"] {
+        background-color: $primary;
+        color: white;
+    }
+    StyledButton[variant="primary"]:hover {
+        background-color: $secondary;
+    }
+    StyledButton[variant="secondary"] {
+        background-color: white;
+        color: $text;
+    }
+    StyledButton[variant="secondary"]:hover {
+        background-color: #f8f9fa;
+    }
+    StyledButton:pressed {
+        padding-left: 18px;
+        padding-top: 10px;
+    }
+    StyledButton:disabled {
+        background-color: #cccccc;
+        color: #666666;
+    }
+    StyledProgressBar {
+        border: none;
+        border-radius: 6px;
+        background-color: #f0f0f0;
+        text-align: center;
+    }
+    StyledProgressBar::chunk {
+        background-color: $primary;
+        border-radius: 6px;
+    }
+    CardFrame {
+        border-radius: 8px;
+        background-color: white;
+        border: 1px solid #e0e0e0;
+    }
+    StyledComboBox {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px 10px;
+        min-height: 28px;
+        background-color: white;
+    }
+    StyledComboBox:hover {
+        border: 1px solid #aaa;
+    }
+    StyledComboBox:focus {
+        border: 1px solid #3498db;
+    }
+    StyledComboBox::drop-down {
+        subcontrol-origin: padding;
+        subcontrol-position: top right;
+        width: 20px;
+        border-left: none;
+    }
+    StyledLineEdit {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px 10px;
+        background-color: white;
+        min-height: 28px;
+    }
+    StyledLineEdit:hover {
+        border: 1px solid #aaa;
+    }
+    StyledLineEdit:focus {
+        border: 1px solid #3498db;
+    }
+    StyledLineEdit:disabled {
+        background-color: #f5f5f5;
+        color: #888;
+    }
+    StyledSpinBox {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        padding: 5px 10px;
+        background-color: white;
+        min-height: 28px;
+    }
+    StyledSpinBox:hover {
+        border: 1px solid #aaa;
+    }
+    StyledSpinBox:focus {
+        border: 1px solid #3498db;
+    }
+    StyledSpinBox::up-button, StyledSpinBox::down-button {
+        subcontrol-origin: padding;
+        width: 20px;
+        border-radius: 2px;
+        background-color: #f5f5f5;
+    }
+    StyledSpinBox::up-button:hover, StyledSpinBox::down-button:hover {
+        background-color: #e0e0e0;
+    }
+    StyledGroupBox {
+        font-weight: bold;
+        border: 1px solid #ccc;
+        border-radius: 5px;
+        margin-top: 1.5ex;
+        padding-top: 10px;
+        background-color: white;
+    }
+    StyledGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 5px;
+        color: #2c3e50;
+    }
+    AppHeader {
+        background-color: #2c3e50;
+        border-bottom: 1px solid #34495e;
+    }
+    QLabel#appTitle {
+        color: white;
+        font-size: 24px;
+        font-weight: bold;
+    }
+    QLabel#appSubtitle {
+        color: #bdc3c7;
+        font-size: 14px;
+    }
+    QLabel#appVersion {
+        color: #7f8c8d;
+        font-size: 12px;
+    }
+    FooterStatusBar {
+        background-color: #f5f5f5;
+        border-top: 1px solid #dcdcdc;
+    }
+    FooterStatusBar QLabel {
+        color: #555;
+    }
+    QLabel#optionsTitle {
+        font-weight: bold;
+        font-size: 14px;
+        color: #2c3e50;
+        margin-bottom: 5px;
+    }
+    QTextEdit#logText {
+        border: 1px solid #ccc;
+        border-radius: 4px;
+        background-color: white;
+        padding: 5px;
+        font-family: monospace;
+    }
+    QPushButton#clearLogButton {
+        background-color: transparent;
+        border: none;
+        color: #3498db;
+        text-decoration: underline;
+        text-align: right;
+    }
+    QPushButton#clearLogButton:hover {
+        color: #2980b9;
+    }
+""")
+APP_QSS = _APP_QSS_TEMPLATE.substitute(
+    primary=ThemeColors.PRIMARY_HEX,
+    secondary=ThemeColors.SECONDARY_HEX,
+    text=ThemeColors.TEXT_HEX,
+)
+
+@functools.lru_cache(maxsize=None)
+def _main_palette():
+    """Build the main window palette once; QPalette needs a running QApplication"""
+    white = QColor(255, 255, 255)
+    palette = QPalette()
+    palette.setColor(QPalette.Window, ThemeColors.BACKGROUND)
+    palette.setColor(QPalette.WindowText, ThemeColors.TEXT)
+    palette.setColor(QPalette.Base, white)
+    palette.setColor(QPalette.Text, ThemeColors.TEXT)
+    palette.setColor(QPalette.Button, ThemeColors.CARD_BG)
+    palette.setColor(QPalette.ButtonText, ThemeColors.TEXT)
+    palette.setColor(QPalette.Highlight, ThemeColors.PRIMARY)
+    palette.setColor(QPalette.HighlightedText, white)
+    return palette
 
 class StyledButton(QPushButton):
     """Custom styled button with hover effects"""
@@ -35,36 +459,14 @@ class StyledButton(QPushButton):
         self.updateStyle()
     
     def updateStyle(self):
-        if self.primary:
-            bg_color = ThemeColors.PRIMARY.name()
-            hover_color = ThemeColors.SECONDARY.name()
-            text_color = "white"
-        else:
-            bg_color = "white"
-            hover_color = "#f8f9fa"
-            text_color = ThemeColors.TEXT.name()
-        
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {bg_color};
-                color: {text_color};
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }}
-            QPushButton:hover {{
-                background-color: {hover_color};
-            }}
-            QPushButton:pressed {{
-                padding-left: 18px;
-                padding-top: 10px;
-            }}
-            QPushButton:disabled {{
-                background-color: #cccccc;
-                color: #666666;
-            }}
-        """)
+        # APP_QSS picks the colors from the variant property; re-polish so a
+        # changed variant takes effect without parsing a stylesheet
+        variant = "primary" if self.primary else "secondary"
+        if self.property("variant") == variant:
+            return  # Unchanged; re-polishing would only invalidate the style cache
+        self.setProperty("variant", variant)
+        self.style().unpolish(self)
+        self.style().polish(self)
 
 class StyledProgressBar(QProgressBar):
     """Custom styled progress bar"""
@@ -73,18 +475,6 @@ class StyledProgressBar(QProgressBar):
         super().__init__(parent)
         self.setFixedHeight(12)
         self.setTextVisible(False)
-        self.setStyleSheet(f"""
-            QProgressBar {{
-                border: none;
-                border-radius: 6px;
-                background-color: #f0f0f0;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {ThemeColors.PRIMARY.name()};
-                border-radius: 6px;
-            }}
-        """)
 
 class CardFrame(QFrame):
     """Card-like frame with shadow effect"""
@@ -96,120 +486,24 @@ class CardFrame(QFrame):
         palette = self.palette()
         palette.setColor(QPalette.Window, ThemeColors.CARD_BG)
         self.setPalette(palette)
-        self.setStyleSheet("""
-            CardFrame {
-                border-radius: 8px;
-                background-color: white;
-                border: 1px solid #e0e0e0;
-            }
-        """)
 
 class StyledComboBox(QComboBox):
     """Custom styled combobox with modern look"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet("""
-            QComboBox {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px 10px;
-                min-height: 28px;
-                background-color: white;
-            }
-            QComboBox:hover {
-                border: 1px solid #aaa;
-            }
-            QComboBox:focus {
-                border: 1px solid #3498db;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 20px;
-                border-left: none;
-            }
-        """)
 
 class StyledLineEdit(QLineEdit):
     """Custom styled line edit with modern look"""
     
     def __init__(self, parent=None, read_only=False):
         super().__init__(parent)
-        self.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px 10px;
-                background-color: white;
-                min-height: 28px;
-            }
-            QLineEdit:hover {
-                border: 1px solid #aaa;
-            }
-            QLineEdit:focus {
-                border: 1px solid #3498db;
-            }
-            QLineEdit:disabled {
-                background-color: #f5f5f5;
-                color: #888;
-            }
-        """)
         
         if read_only:
             self.setReadOnly(True)
             
 class StyledSpinBox(QSpinBox):
     """Custom styled spin box with modern look"""
-    
-    def __init__(self, parent=None):
-        super().__init__(parent)
-        self.setStyleSheet("""
-            QSpinBox {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                padding: 5px 10px;
-                background-color: white;
-                min-height: 28px;
-            }
-            QSpinBox:hover {
-                border: 1px solid #aaa;
-            }
-            QSpinBox:focus {
-                border: 1px solid #3498db;
-            }
-            QSpinBox::up-button, QSpinBox::down-button {
-                subcontrol-origin: padding;
-                width: 20px;
-                border-radius: 2px;
-                background-color: #f5f5f5;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover {
-                background-color: #e0e0e0;
-            }
-        """)
 
 class StyledGroupBox(QGroupBox):
     """Custom styled group box with modern look"""
-    
-    def __init__(self, title, parent=None):
-        super().__init__(title, parent)
-        self.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #ccc;
-                border-radius: 5px;
-                margin-top: 1.5ex;
-                padding-top: 10px;
-                background-color: white;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 5px;
-                color: #2c3e50;
-            }
-        """)
 
 class AppHeader(QFrame):
     """App header with logo, title and theme toggle"""
@@ -217,12 +511,6 @@ class AppHeader(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(80)
-        self.setStyleSheet("""
-            AppHeader {
-                background-color: #2c3e50;
-                border-bottom: 1px solid #34495e;
-            }
-        """)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(20, 10, 20, 10)
@@ -230,18 +518,18 @@ class AppHeader(QFrame):
         # App title and subtitle
         title_layout = QVBoxLayout()
         app_title = QLabel("PageWisePDF")
-        app_title.setStyleSheet("color: white; font-size: 24px; font-weight: bold;")
+        app_title.setObjectName("appTitle")
         
         # Store subtitle label as instance variable
-        self.app_subtitle = QLabel("AI-Powered PDF Processing")
-        self.app_subtitle.setStyleSheet("color: #bdc3c7; font-size: 14px;")
+        self.app_subtitle = QLabel(I18N["English"]["app_subtitle"])
+        self.app_subtitle.setObjectName("appSubtitle")
         
         title_layout.addWidget(app_title)
         title_layout.addWidget(self.app_subtitle)
         
         # Add version on the right
         version_label = QLabel("v1.0")
-        version_label.setStyleSheet("color: #7f8c8d; font-size: 12px;")
+        version_label.setObjectName("appVersion")
         version_label.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
         
         layout.addLayout(title_layout)
@@ -250,7 +538,9 @@ class AppHeader(QFrame):
     
     def set_language(self, language):
         """Update header text based on language"""
-        self.app_subtitle.setText("AI驱动的PDF处理工具" if language == "Chinese" else "AI-Powered PDF Processing")
+        subtitle = I18N.get(language, I18N["English"])["app_subtitle"]
+        if self.app_subtitle.text() != subtitle:  # Skip relayout on no-op updates
+            self.app_subtitle.setText(subtitle)
 
 class FooterStatusBar(QFrame):
     """Custom footer status bar"""
@@ -258,18 +548,11 @@ class FooterStatusBar(QFrame):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setFixedHeight(30)
-        self.setStyleSheet("""
-            FooterStatusBar {
-                background-color: #f5f5f5;
-                border-top: 1px solid #dcdcdc;
-            }
-        """)
         
         layout = QHBoxLayout(self)
         layout.setContentsMargins(10, 0, 10, 0)
         
-        self.status_label = QLabel("Ready")
-        self.status_label.setStyleSheet("color: #555;")
+        self.status_label = QLabel(I18N["English"]["ready"])
         
         layout.addWidget(self.status_label)
         layout.addStretch(1)
@@ -278,14 +561,21 @@ class FooterStatusBar(QFrame):
         self.status_label.setText(text)
 
 class MainWindow(QMainWindow):
+    # File dialog options, shared by every browse call
+    _FILE_OPTS = QFileDialog.Options()
+    _DIR_OPTS = QFileDialog.Options() | QFileDialog.ShowDirsOnly
+    
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("PageWisePDF - PDF OCR and Processing Tool")
+        self.setWindowTitle(I18N["English"]["window_title"])  # Retranslated once settings load
         self.setMinimumSize(950, 750)
         
         # Set application style and font
         self.setup_app_style()
         
+        # Standard icons, looked up once per pixmap type
+        self._icon_cache = {}
+        
         # Initialize settings
         self.settings = QSettings("PageWisePDF", "PageWisePDF")
         self.load_settings()
@@ -295,7 +585,27 @@ class MainWindow(QMainWindow):
         
         # Initialize PDF processor
         self.pdf_processor = None
-        self.processing_thread = None
+        self._current_runnable = None  # Pooled task running pdf_processor
+        self._last_output_dir = None  # Paths of the latest run, set when it starts
+        self._last_consolidated_path = None
+        self._completion_box = None  # Completion dialog, reused across runs
+        self._settings_dialog = None  # Settings dialog, reused until the language changes
+        
+        # HTTP session reused across runs so keep-alive connections survive
+        self.http_session = None
+        self.http_session_pool_size = 0
+        
+        # Page count of the selected PDF, or None if it could not be read
+        self.pdf_page_count = None
+        self._page_count_workers = set()  # Running workers, kept alive until finished
+        
+        # Tray icon for non-blocking completion notices, when the desktop has a tray
+        self.tray = None
+        if QSystemTrayIcon.isSystemTrayAvailable():
+            self.tray = QSystemTrayIcon(self._icon(QStyle.SP_FileDialogContentsView), self)
+            self.tray.setToolTip("PageWisePDF")
+            self.tray.messageClicked.connect(lambda: self.open_output_folder(self._last_output_dir))
+            self.tray.show()
         
         # Set default output directory
         self.set_default_output_dir()
@@ -303,74 +613,60 @@ class MainWindow(QMainWindow):
     def setup_app_style(self):
         """Setup application style with custom fonts and colors"""
         # Set application palette
-        palette = QPalette()
-        palette.setColor(QPalette.Window, ThemeColors.BACKGROUND)
-        palette.setColor(QPalette.WindowText, ThemeColors.TEXT)
-        palette.setColor(QPalette.Base, QColor(255, 255, 255))
-        palette.setColor(QPalette.Text, ThemeColors.TEXT)
-        palette.setColor(QPalette.Button, ThemeColors.CARD_BG)
-        palette.setColor(QPalette.ButtonText, ThemeColors.TEXT)
-        palette.setColor(QPalette.Highlight, ThemeColors.PRIMARY)
-        palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-        self.setPalette(palette)
+        self.setPalette(_main_palette())
         
         # Set font
         default_font = QFont()
         default_font.setPointSize(10)
         self.setFont(default_font)
         
-        # Set application stylesheet
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f8f9fa;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #f0f0f0;
-                width: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #c0c0c0;
-                min-height: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                height: 0px;
-            }
-            QScrollBar:horizontal {
-                border: none;
-                background: #f0f0f0;
-                height: 10px;
-                margin: 0px;
-            }
-            QScrollBar::handle:horizontal {
-                background: #c0c0c0;
-                min-width: 20px;
-                border-radius: 5px;
-            }
-            QScrollBar::add-line:horizontal, QScrollBar::sub-line:horizontal {
-                width: 0px;
-            }
-            QToolTip {
-                border: 1px solid #ccc;
-                background-color: #f8f9fa;
-                color: #333;
-                padding: 5px;
-            }
-        """)
+        # Install the shared stylesheet once for every window and dialog
+        QApplication.instance().setStyleSheet(APP_QSS)
+    
+    def _icon(self, standard_pixmap):
+        """Return the style's standard icon, cached for reuse"""
+        icon = self._icon_cache.get(standard_pixmap)
+        if icon is None:
+            icon = self.style().standardIcon(standard_pixmap)
+            self._icon_cache[standard_pixmap] = icon
+        return icon
     
     def load_settings(self):
+        # Settings live in the "main" group; older versions wrote them at the
+        # top level, so fall back to those keys when the group has no value.
+        # Typed reads convert the stored strings in one call
+        def value(key, default, value_type=str):
+            legacy = self.settings.value(key, default, type=value_type)
+            return self.settings.value(f"main/{key}", legacy, type=value_type)
+        
         # Default settings
-        self.api_key = self.settings.value("api_key", "")
-        self.api_endpoint = self.settings.value("api_endpoint", "https://api.openai.com/v1/chat/completions")
-        self.model_name = self.settings.value("model_name", "gpt-4-vision-preview")
-        self.concurrent_calls = int(self.settings.value("concurrent_calls", 1))
-        self.pages_per_call = int(self.settings.value("pages_per_call", 1))
-        self.language = self.settings.value("language", "English")
-        self.api_call_interval = float(self.settings.value("api_call_interval", 0.0))
+        self.api_key = value("api_key", "")
+        self.api_endpoint = value("api_endpoint", "https://api.openai.com/v1/chat/completions")
+        self.model_name = value("model_name", "gpt-4-vision-preview")
+        self.concurrent_calls = value("concurrent_calls", 1, int)
+        self.pages_per_call = value("pages_per_call", 1, int)
+        self.language = value("language", "English")
+        if self.language not in I18N:
+            self.language = "English"  # Hand-edited or legacy value
+        self._s = I18N[self.language]  # Strings of the current UI language
+        self.requests_per_minute = value("requests_per_minute", 0, int)
+        self.tokens_per_minute = value("tokens_per_minute", 0, int)
+        self.image_format = value("image_format", "jpeg")
+        self.save_images = value("save_images", False, bool)
+        self.save_page_markdown = value("save_page_markdown", False, bool)
+        self.target_max_dim = value("target_max_dim", 2048, int)
+        self.show_completion_popup = value("show_completion_popup", False, bool)
     
     def init_ui(self):
+        # Build the whole tree before the first repaint
+        self.setUpdatesEnabled(False)
+        
+        # Widgets whose text comes from UI_TEXT_SPEC, filled in by retranslate_ui
+        self._widgets = {}
+        
+        # Validity of (path, check) pairs, so repeated checks don't stat again
+        self._path_validity_cache = {}
+        
         # Create central widget with vertical layout
         central_widget = QWidget()
         main_layout = QVBoxLayout(central_widget)
@@ -393,27 +689,26 @@ class MainWindow(QMainWindow):
         
         # Content container (used inside scroll area)
         form_container = QWidget()
-        form_layout = QVBoxLayout(form_container)
+        form_layout = QGridLayout(form_container)
         form_layout.setContentsMargins(5, 5, 5, 15)
         form_layout.setSpacing(15)
         
         # Create file selection section
-        file_group = StyledGroupBox(self.tr("PDF Selection") if self.language == "English" else "PDF 选择")
+        file_group = StyledGroupBox("")
         file_layout = QHBoxLayout()
         
         self.file_path_edit = StyledLineEdit(read_only=True)
-        self.file_path_edit.setPlaceholderText(self.tr("Select a PDF file...") if self.language == "English" else "选择 PDF 文件...")
         
-        browse_button = StyledButton(self.tr("Browse") if self.language == "English" else "浏览", primary=False)
+        browse_button = StyledButton("", primary=False)
         browse_button.clicked.connect(self.browse_pdf)
-        browse_button.setIcon(self.style().standardIcon(QStyle.SP_DialogOpenButton))
+        browse_button.setIcon(self._icon(QStyle.SP_DialogOpenButton))
         
         file_layout.addWidget(self.file_path_edit, 7)
         file_layout.addWidget(browse_button, 1)
         file_group.setLayout(file_layout)
         
         # Create output directory selection
-        output_group = StyledGroupBox(self.tr("Output Directory") if self.language == "English" else "输出目录")
+        output_group = StyledGroupBox("")
         output_layout = QHBoxLayout()
         
         self.output_path_edit = StyledLineEdit(read_only=True)
@@ -421,12 +716,10 @@ class MainWindow(QMainWindow):
         # Set default output directory text
         if hasattr(self, 'default_output_dir') and self.default_output_dir:
             self.output_path_edit.setText(self.default_output_dir)
-        else:
-            self.output_path_edit.setPlaceholderText(self.tr("Select output directory...") if self.language == "English" else "选择输出目录...")
         
-        output_button = StyledButton(self.tr("Browse") if self.language == "English" else "浏览", primary=False)
+        output_button = StyledButton("", primary=False)
         output_button.clicked.connect(self.browse_output_dir)
-        output_button.setIcon(self.style().standardIcon(QStyle.SP_DialogOpenButton))
+        output_button.setIcon(self._icon(QStyle.SP_DialogOpenButton))
         
         output_layout.addWidget(self.output_path_edit, 7)
         output_layout.addWidget(output_button, 1)
@@ -436,8 +729,8 @@ class MainWindow(QMainWindow):
         options_card = CardFrame()
         options_card_layout = QVBoxLayout(options_card)
         
-        options_title = QLabel(self.tr("Processing Options") if self.language == "English" else "处理选项")
-        options_title.setStyleSheet("font-weight: bold; font-size: 14px; color: #2c3e50; margin-bottom: 5px;")
+        options_title = QLabel()
+        options_title.setObjectName("optionsTitle")
         
         options_grid = QFormLayout()
         options_grid.setContentsMargins(10, 10, 10, 10)
@@ -445,25 +738,25 @@ class MainWindow(QMainWindow):
         
         # Processing mode
         self.mode_combo = StyledComboBox()
-        extraction_mode = self.tr("Full Text Extraction") if self.language == "English" else "完整文本提取"
-        summary_mode = self.tr("Summary Mode") if self.language == "English" else "摘要模式"
-        self.mode_combo.addItems([extraction_mode, summary_mode])
-        options_grid.addRow(self.tr("Mode:") if self.language == "English" else "模式:", self.mode_combo)
+        self.mode_combo.addItems(["", ""])
+        mode_label = QLabel()
+        options_grid.addRow(mode_label, self.mode_combo)
         
         # Language selection
         self.language_combo = StyledComboBox()
         self.language_combo.addItems(["English", "中文"])
-        self.language_combo.setCurrentIndex(0 if self.language == "English" else 1)
+        self.language_combo.setCurrentIndex(0 if self.language == "English" else 1)  # Before connecting, so it doesn't fire the slot
         self.language_combo.currentIndexChanged.connect(self.on_language_change)
-        options_grid.addRow(self.tr("Output Language:") if self.language == "English" else "输出语言:", self.language_combo)
+        output_language_label = QLabel()
+        options_grid.addRow(output_language_label, self.language_combo)
         
         # Page range
         page_range_widget = QWidget()
         page_range_layout = QHBoxLayout(page_range_widget)
         page_range_layout.setContentsMargins(0, 0, 0, 0)
         
-        self.process_all_pages = QCheckBox(self.tr("Process all pages") if self.language == "English" else "处理所有页面")
-        self.process_all_pages.setChecked(True)
+        self.process_all_pages = QCheckBox()
+        self.process_all_pages.setChecked(True)  # Spin boxes start disabled to match
         self.process_all_pages.stateChanged.connect(self.toggle_page_range)
         
         self.start_page_spin = StyledSpinBox()
@@ -474,31 +767,56 @@ class MainWindow(QMainWindow):
         self.end_page_spin.setMinimum(1)
         self.end_page_spin.setEnabled(False)
         
+        from_label = QLabel()
+        to_label = QLabel()
+        
         page_range_layout.addWidget(self.process_all_pages)
-        page_range_layout.addWidget(QLabel(self.tr("From:") if self.language == "English" else "从:"))
+        page_range_layout.addWidget(from_label)
         page_range_layout.addWidget(self.start_page_spin)
-        page_range_layout.addWidget(QLabel(self.tr("To:") if self.language == "English" else "到:"))
+        page_range_layout.addWidget(to_label)
         page_range_layout.addWidget(self.end_page_spin)
         page_range_layout.addStretch()
         
-        options_grid.addRow(self.tr("Page Range:") if self.language == "English" else "页面范围:", page_range_widget)
+        page_range_label = QLabel()
+        options_grid.addRow(page_range_label, page_range_widget)
+        
+        # Cache options
+        self.force_refresh_check = QCheckBox()
+        cache_label = QLabel()
+        options_grid.addRow(cache_label, self.force_refresh_check)
         
-        # Settings button
-        settings_button = StyledButton(self.tr("API Settings") if self.language == "English" else "API 设置", primary=False)
-        settings_button.setIcon(self.style().standardIcon(QStyle.SP_FileDialogDetailedView))
+        # Completion notice: tray message by default, optional modal popup
+        self.completion_popup_check = QCheckBox()
+        self.completion_popup_check.setChecked(self.show_completion_popup)
+        self.completion_popup_check.toggled.connect(self.on_completion_popup_toggled)
+        notifications_label = QLabel()
+        options_grid.addRow(notifications_label, self.completion_popup_check)
+        
+        # Settings and cache buttons
+        options_buttons_layout = QHBoxLayout()
+        
+        settings_button = StyledButton("", primary=False)
+        settings_button.setIcon(self._icon(QStyle.SP_FileDialogDetailedView))
         settings_button.clicked.connect(self.open_settings)
         
+        clear_cache_button = StyledButton("", primary=False)
+        clear_cache_button.setIcon(self._icon(QStyle.SP_TrashIcon))
+        clear_cache_button.clicked.connect(self.clear_cache)
+        
+        options_buttons_layout.addWidget(settings_button)
+        options_buttons_layout.addWidget(clear_cache_button)
+        
         # Add all options to card
         options_card_layout.addWidget(options_title)
         options_card_layout.addLayout(options_grid)
         options_card_layout.addSpacing(5)
-        options_card_layout.addWidget(settings_button)
+        options_card_layout.addLayout(options_buttons_layout)
         
         # Create progress section
-        progress_group = StyledGroupBox(self.tr("Progress") if self.language == "English" else "进度")
+        progress_group = StyledGroupBox("")
         progress_layout = QVBoxLayout()
         
-        self.status_label = QLabel(self.tr("Ready") if self.language == "English" else "就绪")
+        self.status_label = QLabel(self._s["ready"])
         self.progress_bar = StyledProgressBar()
         
         progress_layout.addWidget(self.status_label)
@@ -506,36 +824,37 @@ class MainWindow(QMainWindow):
         progress_group.setLayout(progress_layout)
         
         # Create log section
-        log_group = StyledGroupBox(self.tr("Log") if self.language == "English" else "日志")
+        log_group = StyledGroupBox("")
         log_layout = QVBoxLayout()
         
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: white;
-                padding: 5px;
-                font-family: monospace;
-            }
-        """)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)  # Cap memory and layout cost
+        
+        # Long-lived cursor at the end of the log; flushes insert through it
+        self._log_cursor = QTextCursor(self.log_text.document())
+        self._log_cursor.movePosition(QTextCursor.End)
+        
+        # Log lines are buffered and flushed to the text box 50 ms after the
+        # first one arrives, so a burst of lines costs one append and repaint
+        self._log_buffer = deque(maxlen=LOG_MAX_LINES)  # Older lines would be evicted anyway
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(50)
+        self._log_timer.timeout.connect(self._flush_log)
+        
+        # Processor workers put their lines on a bounded queue, polled only
+        # while processing runs
+        self.log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._log_drain_timer = QTimer(self)
+        self._log_drain_timer.setInterval(50)
+        self._log_drain_timer.timeout.connect(self._drain_log_queue)
+        self.log_text.setObjectName("logText")
         
         # Add clear log button
-        clear_log_button = QPushButton(self.tr("Clear Log") if self.language == "English" else "清除日志")
+        clear_log_button = QPushButton()
+        clear_log_button.setObjectName("clearLogButton")
         clear_log_button.clicked.connect(self.clear_log)
-        clear_log_button.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                color: #3498db;
-                text-decoration: underline;
-                text-align: right;
-            }
-            QPushButton:hover {
-                color: #2980b9;
-            }
-        """)
         
         log_layout.addWidget(self.log_text)
         log_layout.addWidget(clear_log_button, 0, Qt.AlignRight)
@@ -545,27 +864,36 @@ class MainWindow(QMainWindow):
         button_layout = QHBoxLayout()
         button_layout.setContentsMargins(0, 10, 0, 0)
         
-        self.start_button = StyledButton(self.tr("Start Processing") if self.language == "English" else "开始处理")
+        self.start_button = StyledButton("")
         self.start_button.setEnabled(False)
         self.start_button.clicked.connect(self.start_processing)
-        self.start_button.setIcon(self.style().standardIcon(QStyle.SP_MediaPlay))
+        self.start_button.setIcon(self._icon(QStyle.SP_MediaPlay))
         
-        self.cancel_button = StyledButton(self.tr("Cancel") if self.language == "English" else "取消", primary=False)
+        self.cancel_button = StyledButton("", primary=False)
         self.cancel_button.setEnabled(False)
         self.cancel_button.clicked.connect(self.cancel_processing)
-        self.cancel_button.setIcon(self.style().standardIcon(QStyle.SP_MediaStop))
+        self.cancel_button.setIcon(self._icon(QStyle.SP_MediaStop))
         
         button_layout.addStretch(1)
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.cancel_button)
         
+        # Re-check inputs 100 ms after the paths stop changing
+        self._validity_timer = QTimer(self)
+        self._validity_timer.setSingleShot(True)
+        self._validity_timer.setInterval(100)
+        self._validity_timer.timeout.connect(self.check_input_validity)
+        self.file_path_edit.textChanged.connect(self._validity_timer.start)
+        self.output_path_edit.textChanged.connect(self._validity_timer.start)
+        
         # Add all components to form layout
-        form_layout.addWidget(file_group)
-        form_layout.addWidget(output_group)
-        form_layout.addWidget(options_card)
-        form_layout.addWidget(progress_group)
-        form_layout.addWidget(log_group, 1)  # Give log more space
-        form_layout.addLayout(button_layout)
+        form_layout.addWidget(file_group, 0, 0)
+        form_layout.addWidget(output_group, 1, 0)
+        form_layout.addWidget(options_card, 2, 0)
+        form_layout.addWidget(progress_group, 3, 0)
+        form_layout.addWidget(log_group, 4, 0)
+        form_layout.addLayout(button_layout, 5, 0)
+        form_layout.setRowStretch(4, 1)  # Give log more space
         
         # Set up the scroll area
         scroll_area.setWidget(form_container)
@@ -573,7 +901,6 @@ class MainWindow(QMainWindow):
         
         # Create footer status bar
         self.footer = FooterStatusBar()
-        self.footer.update_status(self.tr("Ready") if self.language == "English" else "就绪")
         
         # Add all main sections to main layout
         main_layout.addWidget(self.header)
@@ -582,37 +909,92 @@ class MainWindow(QMainWindow):
         
         self.setCentralWidget(central_widget)
         
+        # Register translatable widgets under their UI_TEXT_SPEC keys
+        self._widgets.update({
+            "file_group": file_group,
+            "file_path_edit": self.file_path_edit,
+            "browse_button": browse_button,
+            "output_group": output_group,
+            "output_path_edit": self.output_path_edit,
+            "output_button": output_button,
+            "options_title": options_title,
+            "mode_label": mode_label,
+            "output_language_label": output_language_label,
+            "process_all_pages": self.process_all_pages,
+            "from_label": from_label,
+            "to_label": to_label,
+            "page_range_label": page_range_label,
+            "force_refresh_check": self.force_refresh_check,
+            "cache_label": cache_label,
+            "completion_popup_check": self.completion_popup_check,
+            "notifications_label": notifications_label,
+            "settings_button": settings_button,
+            "clear_cache_button": clear_cache_button,
+            "progress_group": progress_group,
+            "log_group": log_group,
+            "clear_log_button": clear_log_button,
+            "start_button": self.start_button,
+            "cancel_button": self.cancel_button,
+        })
+        
         # Apply initial language
         self.update_ui_language()
+        
+        self.setUpdatesEnabled(True)
     
     def on_language_change(self, index):
         """Handle language combobox changes"""
         language = "English" if index == 0 else "Chinese"
         if language != self.language:
             self.language = language
-            self.save_settings()
+            self._s = I18N[language]
             self.update_ui_language()
     
+    def on_completion_popup_toggled(self, checked):
+        """Remember whether to show the modal completion dialog"""
+        self.show_completion_popup = checked
+    
     def update_ui_language(self):
         """Update UI elements based on selected language"""
+        s = self._s
+        
         # Update header
         self.header.set_language(self.language)
         
         # Update labels
-        self.setWindowTitle("PageWisePDF - PDF OCR and Processing Tool" if self.language == "English" else "PageWisePDF - PDF OCR 和处理工具")
-        
-        # Will update other elements as needed
+        self.retranslate_ui()
         
         # Update footer
-        self.footer.update_status(self.tr("Ready") if self.language == "English" else "就绪")
+        self.footer.update_status(s["ready"])
         
         # Log the language change
-        self.log(self.tr("Language changed to English") if self.language == "English" else "语言已更改为中文")
+        self.log(s["language_changed"])
+    
+    def retranslate_ui(self):
+        """Reapply translated texts to every widget listed in UI_TEXT_SPEC"""
+        s = self._s
+        
+        self.setWindowTitle(s["window_title"])
+        for widget_key, setter_name, string_key in UI_TEXT_SPEC:
+            getattr(self._widgets[widget_key], setter_name)(s[string_key])
+        
+        # Combo items keep their index, so the selected mode survives a switch
+        self.mode_combo.setItemText(0, s["full_text_extraction"])
+        self.mode_combo.setItemText(1, s["summary_mode"])
     
     def clear_log(self):
         """Clear the log text box"""
+        self._log_buffer.clear()
         self.log_text.clear()
-        self.log(self.tr("Log cleared") if self.language == "English" else "日志已清除")
+        self.log(self._s["log_cleared"])
+    
+    def clear_cache(self):
+        """Delete all cached OCR results"""
+        try:
+            removed = OCRCache().clear()
+            self.log(self._s["cache_cleared"].format(count=removed))
+        except Exception as e:
+            self.log(self._s["cache_clear_error"].format(error=e))
     
     def toggle_page_range(self, state):
         """Enable/disable page range spinners based on 'process all pages' checkbox"""
@@ -651,132 +1033,205 @@ class MainWindow(QMainWindow):
     
     def browse_pdf(self):
         """Open a file dialog to select a PDF file"""
-        options = QFileDialog.Options()
-        file_filter = self.tr("PDF Files (*.pdf)") if self.language == "English" else "PDF 文件 (*.pdf)"
+        s = self._s
         file_path, _ = QFileDialog.getOpenFileName(
             self, 
-            self.tr("Select PDF File") if self.language == "English" else "选择 PDF 文件",
+            s["select_pdf_title"],
             "", 
-            file_filter,
-            options=options
+            s["pdf_file_filter"],
+            options=self._FILE_OPTS
         )
         
         if file_path:
+            # Renders cached for the previous PDF are no longer useful
+            if file_path != self.file_path_edit.text():
+                from pdf_processor import clear_render_cache
+                clear_render_cache()
+            
+            # A path picked in the dialog is checked afresh
+            self._path_validity_cache.clear()
             self.file_path_edit.setText(file_path)
-            self.check_input_validity()
             
             # Log the selection
             filename = os.path.basename(file_path)
-            self.log(self.tr(f"Selected file: {filename}") if self.language == "English" else f"已选择文件: {filename}")
+            self.log(s["selected_file"].format(filename=filename))
             
             # If no output directory is set, use the PDF's directory
             if not self.output_path_edit.text():
                 output_dir = os.path.dirname(file_path)
                 self.output_path_edit.setText(output_dir)
             
-            # Try to detect page count to set max value for spinners
-            try:
-                from pypdf import PdfReader
-                reader = PdfReader(file_path)
-                total_pages = len(reader.pages)
-                
-                # Update max values for page range spinners
-                self.start_page_spin.setMaximum(total_pages)
-                self.end_page_spin.setMaximum(total_pages)
-                self.end_page_spin.setValue(total_pages)
-                
-                # Log page count
-                self.log(self.tr(f"PDF has {total_pages} pages") if self.language == "English" else f"PDF 有 {total_pages} 页")
-            except Exception as e:
-                self.log(self.tr(f"Error reading PDF: {str(e)}") if self.language == "English" else f"读取 PDF 时出错: {str(e)}")
+            # Count pages off the GUI thread so large PDFs don't freeze the window
+            self.pdf_page_count = None
+            self.update_status(s["counting_pages"])
+            
+            worker = PageCountWorker(file_path)
+            worker.page_count_ready.connect(self.on_page_count_ready)
+            worker.page_count_failed.connect(self.on_page_count_failed)
+            worker.finished.connect(lambda: self._page_count_workers.discard(worker))
+            self._page_count_workers.add(worker)
+            worker.start()
+    
+    def on_page_count_ready(self, file_path, total_pages):
+        """Bound the page range by the counted pages of the selected PDF"""
+        # Ignore results for a PDF that has since been replaced
+        if file_path != self.file_path_edit.text():
+            return
+        
+        s = self._s
+        self.pdf_page_count = total_pages
+        
+        # Update max values for page range spinners
+        self.start_page_spin.setMaximum(total_pages)
+        self.end_page_spin.setMaximum(total_pages)
+        self.end_page_spin.setValue(total_pages)
+        
+        # Log page count
+        self.log(s["pdf_page_count"].format(count=total_pages))
+        self.update_status(s["ready"])
+    
+    def on_page_count_failed(self, file_path, error):
+        """Log an unreadable PDF; the user can still try to process it"""
+        if file_path != self.file_path_edit.text():
+            return
+        
+        s = self._s
+        self.log(s["pdf_read_error"].format(error=error))
+        self.update_status(s["ready"])
     
     def browse_output_dir(self):
         """Open a directory dialog to select output directory"""
-        options = QFileDialog.Options() | QFileDialog.ShowDirsOnly
+        s = self._s
         dir_path = QFileDialog.getExistingDirectory(
             self, 
-            self.tr("Select Output Directory") if self.language == "English" else "选择输出目录",
+            s["select_output_title"],
             self.default_output_dir if hasattr(self, 'default_output_dir') else "",
-            options=options
+            options=self._DIR_OPTS
         )
         
         if dir_path:
+            self._path_validity_cache.clear()
             self.output_path_edit.setText(dir_path)
-            self.check_input_validity()
             
             # Log the selection
-            self.log(self.tr(f"Output directory: {dir_path}") if self.language == "English" else f"输出目录: {dir_path}")
+            self.log(s["output_directory_selected"].format(path=dir_path))
     
     def check_input_validity(self):
         """Check if all required inputs are valid and enable/disable start button accordingly"""
-        has_pdf = bool(self.file_path_edit.text() and os.path.isfile(self.file_path_edit.text()))
-        has_output = bool(self.output_path_edit.text() and os.path.isdir(self.output_path_edit.text()))
+        has_pdf = self._is_valid_path(self.file_path_edit.text(), os.path.isfile)
+        has_output = self._is_valid_path(self.output_path_edit.text(), os.path.isdir)
         
         self.start_button.setEnabled(has_pdf and has_output)
     
+    def _is_valid_path(self, path, check):
+        """Return check(path), statting each path only once until it is browsed again"""
+        if not path:
+            return False
+        key = (path, check)
+        if key not in self._path_validity_cache:
+            self._path_validity_cache[key] = check(path)
+        return self._path_validity_cache[key]
+    
     def open_settings(self):
         """Open the settings dialog"""
-        dialog = SettingsDialog(self)
+        from settings import SettingsDialog
+        
+        # The dialog's texts are fixed when it is built, so rebuild it only
+        # after a language change; otherwise refresh its values and reopen it
+        dialog = self._settings_dialog
+        if dialog is None or dialog.language != self.language:
+            if dialog is not None:
+                dialog.deleteLater()
+            dialog = self._settings_dialog = SettingsDialog(self)
+        else:
+            dialog.load_settings()
+        
         if dialog.exec_():
-            # Get settings from dialog
-            self.api_key = dialog.api_key_edit.text()
-            self.api_endpoint = dialog.endpoint_edit.text()
-            self.model_name = dialog.model_combo.currentText()
-            self.concurrent_calls = dialog.concurrent_spin.value()
-            self.pages_per_call = dialog.pages_per_call_spin.value()
-            self.api_call_interval = dialog.interval_spin.value()
+            # Only keys the user actually changed are applied and written back
+            values = dialog.values()
+            changed = [key for key, value in values.items() if getattr(self, key) != value]
+            if not changed:
+                return
+            for key in changed:
+                setattr(self, key, values[key])
             
             # Save settings
-            self.save_settings()
+            self.save_settings(changed)
             
             # Log settings change
-            self.log(self.tr("Settings updated") if self.language == "English" else "设置已更新")
-    
-    def save_settings(self):
-        """Save settings to QSettings"""
-        self.settings.setValue("api_key", self.api_key)
-        self.settings.setValue("api_endpoint", self.api_endpoint)
-        self.settings.setValue("model_name", self.model_name)
-        self.settings.setValue("concurrent_calls", self.concurrent_calls)
-        self.settings.setValue("pages_per_call", self.pages_per_call)
-        self.settings.setValue("language", self.language)
-        self.settings.setValue("api_call_interval", self.api_call_interval)
+            self.log(self._s["settings_updated"])
+    
+    def save_settings(self, keys=SETTINGS_KEYS):
+        """Save the given settings keys to QSettings as one group and flush them once"""
+        self.settings.beginGroup("main")
+        try:
+            for key in keys:
+                self.settings.setValue(key, getattr(self, key))
+        finally:
+            # Always leave the group so later reads and writes use top-level keys
+            self.settings.endGroup()
+        self.settings.sync()
     
     def log(self, message):
         """Add a message to the log text box"""
-        from datetime import datetime
+        # Buffer until the pending flush, which adds the timestamp
+        self._log_buffer.append(message)
+        if not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _drain_log_queue(self):
+        """Move up to LOG_DRAIN_BATCH queued processor lines into the log"""
+        for _ in range(LOG_DRAIN_BATCH):
+            try:
+                message = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.log(message)
+    
+    def _flush_log(self):
+        """Append all buffered log lines to the log text box at once"""
+        if not self._log_buffer:
+            return
         
-        # Add timestamp
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        timestamped_message = f"[{timestamp}] {message}"
+        # Lines of one batch arrive within the debounce interval, so they
+        # share a timestamp formatted once
+        prefix = f"[{datetime.now().strftime('%H:%M:%S')}] "
+        lines = []
+        while self._log_buffer:
+            lines.append(prefix + self._log_buffer.popleft())
         
-        # Append to log
-        self.log_text.append(timestamped_message)
+        # Insert at the end in one edit, starting a new line unless the log is empty
+        text = "\n".join(lines)
+        if not self.log_text.document().isEmpty():
+            text = "\n" + text
+        self._log_cursor.movePosition(QTextCursor.End)  # Stays valid after clear()
+        self._log_cursor.insertText(text)
         
         # Auto-scroll to bottom
-        cursor = self.log_text.textCursor()
-        cursor.movePosition(cursor.End)
-        self.log_text.setTextCursor(cursor)
+        self.log_text.setTextCursor(self._log_cursor)
     
     def start_processing(self):
         """Start PDF processing"""
-        # Validate PDF file
+        s = self._s
+        
+        # Validate PDF file. Paths already checked by check_input_validity are
+        # not statted again, which can block for seconds on network mounts
         pdf_path = self.file_path_edit.text()
-        if not os.path.isfile(pdf_path):
+        if not self._is_valid_path(pdf_path, os.path.isfile):
             QMessageBox.warning(
                 self,
-                self.tr("Invalid PDF") if self.language == "English" else "无效的 PDF",
-                self.tr("Please select a valid PDF file.") if self.language == "English" else "请选择有效的 PDF 文件。"
+                s["invalid_pdf_title"],
+                s["invalid_pdf_message"]
             )
             return
         
         # Validate output directory
         output_dir = self.output_path_edit.text()
-        if not os.path.isdir(output_dir):
+        if not self._is_valid_path(output_dir, os.path.isdir):
             QMessageBox.warning(
                 self,
-                self.tr("Invalid Output Directory") if self.language == "English" else "无效的输出目录",
-                self.tr("Please select a valid output directory.") if self.language == "English" else "请选择有效的输出目录。"
+                s["invalid_output_title"],
+                s["invalid_output_message"]
             )
             return
         
@@ -784,8 +1239,8 @@ class MainWindow(QMainWindow):
         if not self.api_key:
             QMessageBox.warning(
                 self,
-                self.tr("API Key Required") if self.language == "English" else "需要 API 密钥",
-                self.tr("Please enter your OpenAI API key in settings.") if self.language == "English" else "请在设置中输入您的 OpenAI API 密钥。"
+                s["api_key_required_title"],
+                s["api_key_required_message"]
             )
             self.open_settings()
             return
@@ -813,6 +1268,18 @@ class MainWindow(QMainWindow):
             start_page = self.start_page_spin.value()
             end_page = self.end_page_spin.value()
         
+        # Rate limiter shared by all API workers of this run
+        rate_limiter = TokenBucket(self.requests_per_minute, self.tokens_per_minute)
+        
+        from pdf_processor import PDFProcessor, create_http_session
+        
+        # Reuse the HTTP session unless the connection pool size changed
+        if self.http_session is None or self.http_session_pool_size != self.concurrent_calls:
+            if self.http_session is not None:
+                self.http_session.close()
+            self.http_session = create_http_session(self.concurrent_calls)
+            self.http_session_pool_size = self.concurrent_calls
+        
         # Create PDF processor
         self.pdf_processor = PDFProcessor(
             pdf_path=pdf_path,
@@ -826,53 +1293,89 @@ class MainWindow(QMainWindow):
             concurrent_calls=self.concurrent_calls,
             pages_per_call=self.pages_per_call,
             language=output_language,
-            api_call_interval=self.api_call_interval
+            rate_limiter=rate_limiter,
+            cache=OCRCache(),
+            force_refresh=self.force_refresh_check.isChecked(),
+            session=self.http_session,
+            image_format=self.image_format,
+            save_images=self.save_images,
+            save_page_markdown=self.save_page_markdown,
+            target_max_dim=self.target_max_dim,
+            log_queue=self.log_queue,
+            page_count=self.pdf_page_count
         )
         
-        # Set up signal connections
-        self.pdf_processor.status_update.connect(self.update_status)
-        self.pdf_processor.progress_update.connect(self.update_progress)
-        self.pdf_processor.log_update.connect(self.log)
+        # Set up signal connections. The processor emits from its worker
+        # threads, so each signal is queued once straight onto the GUI thread.
+        # Log lines bypass signals through log_queue
+        self.pdf_processor.status_update.connect(self.update_status, Qt.QueuedConnection)
+        self.pdf_processor.progress_update.connect(self.update_progress, Qt.QueuedConnection)
         
-        # Create processing thread
-        self.processing_thread = PDFProcessorThread(self.pdf_processor)
-        self.processing_thread.finished.connect(self.on_processing_finished)
+        # Remember the run's paths so completion never reads the widgets back
+        self._last_output_dir = output_dir
+        self._last_consolidated_path = self.pdf_processor.consolidated_path
+        
+        # Create processing task
+        self._current_runnable = PDFProcessorRunnable(self.pdf_processor)
+        self._current_runnable.signals.finished.connect(self.on_processing_finished)
         
         # Start processing
-        mode_text = self.tr("summary") if is_summary_mode else self.tr("OCR")
-        self.log(self.tr(f"Starting {mode_text} processing with {self.model_name}...")
-                if self.language == "English"
-                else f"开始使用 {self.model_name} 进行{mode_text}处理...")
+        s = self._s
+        mode_text = s["mode_summary"] if is_summary_mode else s["mode_ocr"]
+        self.log(s["starting_processing"].format(mode=mode_text, model=self.model_name))
         
         # Update status
-        status_text = self.tr("Processing PDF...") if self.language == "English" else "正在处理 PDF..."
+        status_text = s["processing_pdf"]
         self.update_status(status_text)
-        self.footer.update_status(status_text)
         
-        # Start thread
-        self.processing_thread.start()
+        # Start the task on a pooled thread and poll its log lines
+        self._log_drain_timer.start()
+        QThreadPool.globalInstance().start(self._current_runnable)
     
     def cancel_processing(self):
         """Cancel the PDF processing"""
-        if self.pdf_processor and self.processing_thread and self.processing_thread.isRunning():
+        if self.pdf_processor and self._current_runnable is not None:
             # Log cancellation
-            self.log(self.tr("Cancelling processing...") if self.language == "English" else "正在取消处理...")
+            s = self._s
+            self.log(s["cancelling_processing"])
             
             # Tell the processor to cancel
             self.pdf_processor.cancel()
             
             # Update status
-            cancel_text = self.tr("Cancelling...") if self.language == "English" else "正在取消..."
+            cancel_text = s["cancelling"]
             self.update_status(cancel_text)
-            self.footer.update_status(cancel_text)
             
             # Disable cancel button to prevent multiple clicks
             self.cancel_button.setEnabled(False)
     
+    def closeEvent(self, event):
+        """Persist settings, stop a running job, wait for page counts and release pooled HTTP connections on close"""
+        self.save_settings()
+        
+        # The pool thread keeps the application alive until the task returns
+        if self.pdf_processor and self._current_runnable is not None:
+            self.pdf_processor.cancel()
+        
+        # Destroying a QThread that is still running aborts the application,
+        # so let any page count in progress finish first
+        for worker in list(self._page_count_workers):
+            worker.wait()
+        
+        if self.tray is not None:
+            self.tray.hide()
+        
+        if self.http_session is not None:
+            self.http_session.close()
+            self.http_session = None
+        super().closeEvent(event)
+    
     def update_status(self, status):
-        """Update the status label"""
+        """Update the status label and footer, skipping repeats of the current text"""
+        if status == self.status_label.text():
+            return
         self.status_label.setText(status)
-        self.footer.update_status(status)
+        self.footer.status_label.setText(status)
     
     def update_progress(self, value):
         """Update the progress bar"""
@@ -880,72 +1383,87 @@ class MainWindow(QMainWindow):
     
     def on_processing_finished(self):
         """Handle the completion of PDF processing"""
+        s = self._s
+        
+        # Show the processor's last log lines before the completion messages
+        self._log_drain_timer.stop()
+        while not self.log_queue.empty():
+            self._drain_log_queue()
+        
         # Re-enable UI controls
         self.check_input_validity()  # This will properly enable/disable the start button
         self.cancel_button.setEnabled(False)
         
         # Check if processing was cancelled
         if self.pdf_processor and self.pdf_processor.is_cancelled():
-            status_text = self.tr("Processing cancelled") if self.language == "English" else "处理已取消"
+            status_text = s["processing_cancelled"]
             self.update_status(status_text)
             self.log(status_text)
         else:
-            status_text = self.tr("Processing completed") if self.language == "English" else "处理完成"
+            status_text = s["processing_completed"]
             self.update_status(status_text)
             self.log(status_text)
             
             # Show completion message with output path
-            output_dir = self.output_path_edit.text()
-            filename = os.path.basename(self.file_path_edit.text()).split('.')[0]
-            md_path = os.path.join(output_dir, f"{filename}_consolidated.md")
+            md_path = self._last_consolidated_path
             
-            if os.path.exists(md_path):
-                # Offer to open the output file
-                message_box = QMessageBox(self)
-                message_box.setWindowTitle(self.tr("Processing Complete") if self.language == "English" else "处理完成")
-                message_box.setText(self.tr(f"PDF processing completed successfully!\nOutput saved to: {md_path}")
-                                   if self.language == "English"
-                                   else f"PDF 处理成功完成！\n输出已保存到: {md_path}")
-                
-                # Add open folder button
-                open_folder_button = message_box.addButton(
-                    self.tr("Open Folder") if self.language == "English" else "打开文件夹",
-                    QMessageBox.ActionRole
+            if os.path.exists(md_path) and self.tray is not None and not self.show_completion_popup:
+                # Non-blocking notice; clicking it opens the output folder
+                self.tray.showMessage(
+                    "PageWisePDF",
+                    s["processing_complete_message"].format(path=md_path),
+                    QSystemTrayIcon.Information,
+                    3000
                 )
-                
-                # Add close button
-                close_button = message_box.addButton(QMessageBox.Close)
+            elif os.path.exists(md_path):
+                # Offer to open the output file
+                message_box, open_folder_button = self._completion_message_box()
+                message_box.setWindowTitle(s["processing_complete_title"])
+                message_box.setText(s["processing_complete_message"].format(path=md_path))
+                open_folder_button.setText(s["open_folder"])
                 
                 message_box.exec_()
                 
                 # Handle button click
                 if message_box.clickedButton() == open_folder_button:
-                    self.open_output_folder()
+                    self.open_output_folder(self._last_output_dir)
         
         # Clean up
         self.pdf_processor = None
-        self.processing_thread = None
+        self._current_runnable = None
     
-    def open_output_folder(self):
+    def _completion_message_box(self):
+        """Return the completion dialog and its open folder button, built on first use"""
+        if self._completion_box is None:
+            message_box = QMessageBox(self)
+            open_folder_button = message_box.addButton(
+                self._s["open_folder"],
+                QMessageBox.ActionRole
+            )
+            message_box.addButton(QMessageBox.Close)
+            self._completion_box = (message_box, open_folder_button)
+        return self._completion_box
+    
+    def open_output_folder(self, output_dir=None):
         """Open the output folder in the system file explorer"""
-        output_dir = self.output_path_edit.text()
+        if output_dir is None:
+            output_dir = self.output_path_edit.text()
         if os.path.isdir(output_dir):
-            # Platform-specific code to open folder
-            if sys.platform == 'win32':
-                os.startfile(output_dir)
-            elif sys.platform == 'darwin':  # macOS
-                import subprocess
-                subprocess.call(['open', output_dir])
-            else:  # Linux
-                import subprocess
-                subprocess.call(['xdg-open', output_dir])
+            open_in_file_manager(output_dir)
 
-class PDFProcessorThread(QThread):
-    """Thread for PDF processing to keep the UI responsive"""
+class PDFProcessorRunnable(QRunnable):
+    """Pooled task for PDF processing to keep the UI responsive"""
+    
+    class Signals(QObject):
+        """QRunnable is not a QObject, so its signals live on a helper"""
+        finished = pyqtSignal()
     
     def __init__(self, pdf_processor):
         super().__init__()
         self.pdf_processor = pdf_processor
+        self.signals = self.Signals()
+        # MainWindow keeps the reference; don't let the pool delete it under us
+        self.setAutoDelete(False)
     
     def run(self):
         """Run the PDF processor"""
@@ -953,8 +1471,30 @@ class PDFProcessorThread(QThread):
             self.pdf_processor.process()
         except Exception as e:
             # Log and report any unhandled exceptions
-            self.pdf_processor.log(f"Error: {str(e)}")
+            self.pdf_processor.log(self.pdf_processor._s["error"].format(error=e))
             self.pdf_processor.status_update.emit(str(e))
+        finally:
+            self.signals.finished.emit()
+
+class PageCountWorker(QThread):
+    """Thread that reads the page count of a PDF without blocking the UI"""
+    page_count_ready = pyqtSignal(str, int)
+    page_count_failed = pyqtSignal(str, str)
+    
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+    
+    def run(self):
+        """Open the PDF and report its page count"""
+        try:
+            import fitz
+            with fitz.open(self.file_path) as document:
+                total_pages = document.page_count
+        except Exception as e:
+            self.page_count_failed.emit(self.file_path, str(e))
+        else:
+            self.page_count_ready.emit(self.file_path, total_pages)
 
 # Application entry point
 def main():
@@ -0,0 +1,65 @@
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+
+# Default location of the persistent OCR result cache
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".pagewisepdf", "cache")
+
+
+class OCRCache:
+    """Disk-backed cache of model responses keyed by model, prompt and page images"""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def make_key(self, model_name, prompt, images):
+        """Return the cache key for a model, prompt text and list of image bytes"""
+        digest = hashlib.sha256()
+        # Model and prompt are part of the key so changing either invalidates entries
+        digest.update(model_name.encode('utf-8'))
+        digest.update(prompt.encode('utf-8'))
+        for image_bytes in images:
+            digest.update(image_bytes)
+        return digest.hexdigest()
+
+    def _entry_path(self, key):
+        """Shard entries by the first two hex digits to keep directories small"""
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def get(self, key):
+        """Return the cached response for key, or None on a miss"""
+        try:
+            # One read of the raw bytes; json decodes UTF-8 itself
+            return json.loads(Path(self._entry_path(key)).read_bytes())["response"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key, response):
+        """Store a response atomically so concurrent readers never see partial files"""
+        entry_path = self._entry_path(key)
+        entry_dir = os.path.dirname(entry_path)
+        os.makedirs(entry_dir, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"response": response}, f, ensure_ascii=False)
+            os.replace(tmp_path, entry_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def clear(self):
+        """Delete all cached entries and return how many were removed"""
+        if not os.path.isdir(self.cache_dir):
+            return 0
+
+        count = 0
+        for _, _, files in os.walk(self.cache_dir):
+            count += sum(1 for f in files if f.endswith('.json'))
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+        return count
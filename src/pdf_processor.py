@@ -1,22 +1,306 @@
 import os
 import io
+import re
 import tempfile
 from pathlib import Path
 import base64
 import json
 import concurrent.futures
+import multiprocessing
+import hashlib
+import mmap
+import shutil
+from collections import OrderedDict
 import threading
-from queue import Queue
+import random
+from queue import Queue, Full
 import time
 import sys
 
 from PyQt5.QtCore import QObject, pyqtSignal
 import fitz  # PyMuPDF
-from pypdf import PdfReader
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from PIL import Image
 from tqdm import tqdm
 
+try:
+    import blake3  # Optional: SIMD-accelerated hashing of large PDFs
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson  # Optional: fast serialization of multi-megabyte request bodies
+except ImportError:
+    orjson = None
+
+# Page image formats: file extension and data URL MIME type
+IMAGE_FORMATS = {
+    "jpeg": ("jpg", "image/jpeg"),
+    "png": ("png", "image/png"),
+}
+JPEG_QUALITY = 80  # Vision models tolerate mild JPEG artifacts; uploads shrink several-fold
+MAX_ZOOM = 3.0  # Highest render scale (216 DPI), used for small pages
+TARGET_MAX_DIM = 2048  # Default longest image side; vision APIs downscale anything larger
+
+MAX_TOKENS = 4096  # Completion token limit per API call
+IMAGE_TOKEN_ESTIMATE = 1105  # Upper estimate of prompt tokens per high-detail page image
+API_MAX_ATTEMPTS = 5  # Tries per API call when the server reports a transient error
+API_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+API_MAX_RETRY_DELAY = 60.0  # Seconds; also caps what Retry-After may ask for
+IMAGE_URL_PLACEHOLDER = "__page_image_{index}__"  # Replaced by a data URL in the serialized body
+
+# Page headers like "# Page X" or "## 第 X 页" that split multi-page responses
+PAGE_HEADER_PATTERNS = {
+    "English": re.compile(r'#+\s*Page\s+(\d+)', re.IGNORECASE),
+    "Chinese": re.compile(r'#+\s*第\s*(\d+)\s*页', re.IGNORECASE),
+}
+
+# Model prompts for each output language. Multi-page calls add page_markers
+# so the response can be split into one section per page
+PROMPTS = {
+    "English": {
+        "summary_system": "You are an AI assistant that summarizes content from images of PDF pages.",
+        "summary_request": " of a PDF document. Please summarize the key points in markdown format. Begin with the page number(s) as a header.",
+        "ocr_system": "You are an OCR assistant that extracts text from PDF page images. Preserve the original formatting including tables, equations, and hierarchical structure. Output in markdown format.",
+        "ocr_request": " of a PDF document. Extract all text and formatted elements (tables, equations, etc.) faithfully preserving the original structure. Output in markdown format. Begin with the page number as a header and include ONLY the extracted content, no explanations or notes.",
+        "single_page": "This is page {page}",
+        "page_range": "These are pages {first}-{last}",
+        "page_markers": (" The images are given in page order. Start the content of each page with its own "
+                         "header line in the form '# Page N', for example '# Page {first}'."),
+    },
+    "Chinese": {
+        "summary_system": "你是一个AI助手，用于总结PDF页面图像中的内容。",
+        "summary_request": "。请用Markdown格式总结关键要点。请以页码作为标题开始。",
+        "ocr_system": "你是一个OCR助手，用于从PDF页面图像中提取文本。保留原始格式，包括表格、方程式和层次结构。以Markdown格式输出。",
+        "ocr_request": "。提取所有文本和格式化元素（表格、方程式等），忠实保留原始结构。以Markdown格式输出。以页码作为标题开始，只包含提取的内容，不要有解释或注释。",
+        "single_page": "这是PDF文档的第{page}页",
+        "page_range": "这是PDF文档的第{first}-{last}页",
+        "page_markers": "图像按页码顺序给出。每一页的内容都以单独的标题行开始，格式为'# 第 N 页'，例如'# 第 {first} 页'。",
+    },
+}
+
+# Log and status messages for each output language, filled in with str.format
+MESSAGES = {
+    "English": {
+        "processing_started": "Starting PDF processing...",
+        "page_count": "PDF has {count} pages",
+        "page_range": "Processing pages {start} to {end} ({count} pages)",
+        "converting_status": "Converting PDF to images...",
+        "converting": "Converting PDF pages to images...",
+        "cancelled": "Operation cancelled.",
+        "ocr_status": "Processing images with OCR...",
+        "ocr_started": "Starting OCR processing...",
+        "rate_limit": "Using rate limit of {rpm} requests/min and {tpm} tokens/min",
+        "unlimited": "unlimited",
+        "pages_error": "Error processing pages: {error}",
+        "api_retry": "API returned {status}, retrying in {delay:.1f}s (attempt {attempt} of {attempts})",
+        "consolidating_status": "Consolidating results...",
+        "consolidating": "Consolidating markdown files...",
+        "consolidated": "Consolidated file created: {path}",
+        "completed": "Processing completed",
+        "error": "Error: {error}",
+        "error_status": "Error occurred",
+        "render_reused": "Reused rendered image for page {page}",
+        "page_converted": "Converted page {page} to image",
+        "page_skipped": "Skipping page {page}: {error}",
+        "convert_error": "Error converting PDF to images: {error}",
+        "loaded_from_cache": "Loaded page(s) {pages} from cache",
+        "cache_write_error": "Could not cache page(s) {pages}: {error}",
+        "page_processed": "Processed page {page}",
+        "page_group_error": "Error processing page(s) {pages}: {error}",
+        "no_page_headers": "Warning: No page headers found in multi-page response. Using heuristic splitting.",
+        "poppler_found": "Found Poppler at: {path}",
+    },
+    "Chinese": {
+        "processing_started": "开始处理 PDF...",
+        "page_count": "PDF 有 {count} 页",
+        "page_range": "处理第 {start} 页到第 {end} 页（共 {count} 页）",
+        "converting_status": "正在将 PDF 转换为图像...",
+        "converting": "正在将 PDF 页面转换为图像...",
+        "cancelled": "操作已取消。",
+        "ocr_status": "正在使用 OCR 处理图像...",
+        "ocr_started": "开始 OCR 处理...",
+        "rate_limit": "使用速率限制：每分钟 {rpm} 个请求，每分钟 {tpm} 个令牌",
+        "unlimited": "不限",
+        "pages_error": "处理页面时出错：{error}",
+        "api_retry": "API 返回 {status}，{delay:.1f} 秒后重试（第 {attempt} 次，共 {attempts} 次）",
+        "consolidating_status": "正在整合结果...",
+        "consolidating": "正在整合 Markdown 文件...",
+        "consolidated": "已创建整合文件：{path}",
+        "completed": "处理完成",
+        "error": "错误：{error}",
+        "error_status": "发生错误",
+        "render_reused": "已复用第 {page} 页的渲染图像",
+        "page_converted": "已将第 {page} 页转换为图像",
+        "page_skipped": "跳过第 {page} 页：{error}",
+        "convert_error": "将PDF转换为图像时出错：{error}",
+        "loaded_from_cache": "已从缓存加载第 {pages} 页",
+        "cache_write_error": "无法缓存第 {pages} 页：{error}",
+        "page_processed": "已处理第 {page} 页",
+        "page_group_error": "处理第 {pages} 页时出错：{error}",
+        "no_page_headers": "警告：在多页响应中未找到页面标题。使用启发式拆分。",
+        "poppler_found": "在以下位置找到Poppler：{path}",
+    },
+}
+
+
+# Document opened once per render worker process by _init_render_worker
+_worker_document = None
+_worker_rendered = 0  # Pages rendered by this worker, for periodic store trimming
+
+# MuPDF keeps decoded images and fonts in a global store that only grows
+# while a worker renders; it is emptied after this many pages per worker
+RENDER_STORE_SHRINK_INTERVAL = 10
+
+
+def _init_render_worker(pdf_path):
+    """Open the PDF once in each worker process of the render pool.
+
+    Parsing the document (xref table, page tree) is paid per process instead
+    of per page, and worker processes render in parallel without sharing the
+    GIL of the GUI process.
+    """
+    global _worker_document
+    _worker_document = fitz.open(pdf_path)
+
+
+def _render_page(page_idx, target_max_dim, image_format):
+    """Render a single PDF page to encoded image bytes in a render worker process"""
+    global _worker_rendered
+    page = _worker_document[page_idx]
+    
+    # Scale so the longest side is at most target_max_dim pixels. Large pages
+    # would otherwise be rasterized, encoded and uploaded at full size only
+    # for the API to shrink them
+    rect = page.rect
+    zoom_factor = min(MAX_ZOOM, target_max_dim / max(rect.width, rect.height, 1))
+    matrix = fitz.Matrix(zoom_factor, zoom_factor)
+    
+    # Render page to an image (pixmap) and encode it in memory
+    pixmap = page.get_pixmap(matrix=matrix, alpha=False)
+    if image_format == "jpeg":
+        # Pillow's encoder is several times faster than MuPDF's own JPEG output
+        # and, with optimize, its files are smaller too
+        image_bytes = pixmap.pil_tobytes(format="JPEG", quality=JPEG_QUALITY, optimize=True)
+    else:
+        image_bytes = pixmap.tobytes("png")
+    
+    # Release the pixmap samples now and keep the MuPDF store bounded, so
+    # scanned documents don't accumulate every decoded page image
+    pixmap = None
+    _worker_rendered += 1
+    if _worker_rendered % RENDER_STORE_SHRINK_INTERVAL == 0:
+        fitz.TOOLS.store_shrink(100)
+    
+    # Sent straight to the API; only written to disk when page images are kept
+    return image_bytes
+
+
+# In-process LRU of encoded page images keyed by (pdf_hash, page_idx, max dimension, format),
+# bounded by total encoded size since PNG pages can be several MB each
+RENDER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_render_cache = OrderedDict()
+_render_cache_bytes = 0
+_render_cache_lock = threading.Lock()
+
+
+def get_cached_render(key):
+    """Return cached image bytes for a rendered page, or None"""
+    with _render_cache_lock:
+        image_bytes = _render_cache.get(key)
+        if image_bytes is not None:
+            _render_cache.move_to_end(key)
+        return image_bytes
+
+
+def put_cached_render(key, image_bytes):
+    """Store rendered image bytes, evicting the least recently used pages"""
+    global _render_cache_bytes
+    # A page larger than the whole budget would only evict everything else
+    if len(image_bytes) > RENDER_CACHE_MAX_BYTES:
+        return
+    
+    with _render_cache_lock:
+        previous = _render_cache.pop(key, None)
+        if previous is not None:
+            _render_cache_bytes -= len(previous)
+        _render_cache[key] = image_bytes
+        _render_cache_bytes += len(image_bytes)
+        while _render_cache_bytes > RENDER_CACHE_MAX_BYTES:
+            _, evicted = _render_cache.popitem(last=False)
+            _render_cache_bytes -= len(evicted)
+
+
+def clear_render_cache():
+    """Drop all cached page renders"""
+    global _render_cache_bytes
+    with _render_cache_lock:
+        _render_cache.clear()
+        _render_cache_bytes = 0
+
+
+def hash_file(path):
+    """Return a 256-bit hex digest of a file, hashed from a read-only memory map.
+
+    Uses BLAKE3 when the blake3 package is installed and SHA-256 otherwise.
+    Mapping the file lets the OS page it in without copying it into Python
+    buffers, and both hashes release the GIL while digesting.
+    """
+    digest = blake3.blake3() if blake3 is not None else hashlib.sha256()
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # Empty files can't be mapped and hash to the empty digest
+        if os.fstat(fd).st_size > 0:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                digest.update(mapped)
+    finally:
+        os.close(fd)
+    return digest.hexdigest()
+
+
+def prefetch_file(path):
+    """Ask the kernel to start reading a file into the page cache in the background.
+
+    Render workers then read the PDF from memory instead of waiting on disk.
+    Only available where os.posix_fadvise exists (Linux and most Unixes).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass  # Prefetching is only a hint
+
+
+def dumps_json(obj):
+    """Serialize obj to UTF-8 JSON bytes, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def create_http_session(pool_size):
+    """Create an HTTP session keeping up to pool_size keep-alive connections per host.
+
+    Failed connection attempts are retried with backoff. Nothing has been
+    sent at that point, so unlike read or status retries they can't bill a
+    request twice.
+    """
+    session = requests.Session()
+    retries = Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.5)
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class PDFProcessor(QObject):
     status_update = pyqtSignal(str)
     progress_update = pyqtSignal(int)
@@ -25,37 +309,103 @@ class PDFProcessor(QObject):
     def __init__(self, pdf_path, output_dir, api_key, api_endpoint, model_name,
                  is_summary_mode=False, start_page=None, end_page=None, 
                  concurrent_calls=1, pages_per_call=1, language="English",
-                 api_call_interval=0.0):
+                 rate_limiter=None, cache=None, force_refresh=False, session=None,
+                 image_format="jpeg", log_queue=None, page_count=None, save_images=False,
+                 target_max_dim=TARGET_MAX_DIM, save_page_markdown=False):
         super().__init__()
         
+        # Unknown languages use English for messages, prompts and page headers alike
+        if language not in PROMPTS:
+            language = "English"
+        
         self.pdf_path = pdf_path
         self.output_dir = output_dir
+        # splitext keeps dotted names like "v1.2.report.pdf" intact
+        self.pdf_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        self.consolidated_path = os.path.join(output_dir, f"{self.pdf_name}_consolidated.md")
         self.api_key = api_key
         # Process API endpoint based on rules
         self.api_endpoint = self.process_api_endpoint(api_endpoint)
         self.model_name = model_name
         self.is_summary_mode = is_summary_mode
+        self.pdf_hash = None  # Content hash of the PDF, computed when processing starts
         self.start_page = start_page
         self.end_page = end_page
+        self.page_count = page_count  # Page count read when the PDF was selected, if known
         self.concurrent_calls = concurrent_calls
         self.pages_per_call = pages_per_call
         self.language = language
-        self.api_call_interval = api_call_interval
+        self._s = MESSAGES[language]  # Messages in the output language
+        
+        # Prompts depend only on language and mode, so their templates are built once
+        prompts = PROMPTS[language]
+        mode = "summary" if is_summary_mode else "ocr"
+        self._system_prompt = prompts[f"{mode}_system"]
+        self._single_page_prompt = prompts["single_page"] + prompts[f"{mode}_request"]
+        self._page_range_prompt = prompts["page_range"] + prompts[f"{mode}_request"] + prompts["page_markers"]
+        self.rate_limiter = rate_limiter  # Shared TokenBucket, or None for no limit
+        self.cache = cache  # OCRCache for model responses, or None to disable caching
+        self.force_refresh = force_refresh  # Ignore cached responses but still update them
+        self.image_format = image_format if image_format in IMAGE_FORMATS else "jpeg"
+        self.save_images = save_images  # Also write page images to the images folder
+        self.target_max_dim = target_max_dim  # Longest side of rendered page images in pixels
+        self.save_page_markdown = save_page_markdown  # Also write each page's markdown to the md folder
         
-        self.cancelled = False
-        self._thread_lock = threading.Lock()
-        self._api_call_lock = threading.Lock()  # Lock for API call interval management
-        self._last_api_call_time = 0  # Track last API call time
+        # Shared requests.Session; when the caller passes one it is kept open
+        # after the run so its connections can be reused by the next run
+        self.session = session
+        self._owns_session = session is None
+        
+        # Bounded queue drained by the GUI; without one, logs go through log_update
+        self.log_queue = log_queue
+        
+        self._cancel_event = threading.Event()  # Set once by cancel(), polled by every loop
+        self._last_progress = None  # Last value sent through progress_update
+        self._progress_lock = threading.Lock()  # Render and API threads both advance progress
+        self._total_pages = self._total_groups = 1
+        self._pages_rendered = self._groups_completed = 0
+        
+        # Markdown of each finished page, consolidated straight from memory
+        self._page_results = {}
+        self._results_lock = threading.Lock()
         
         # Create output directories
         self.images_dir = os.path.join(output_dir, "images")
         self.md_dir = os.path.join(output_dir, "md")
-        os.makedirs(self.images_dir, exist_ok=True)
-        os.makedirs(self.md_dir, exist_ok=True)
+        if save_images:
+            os.makedirs(self.images_dir, exist_ok=True)
+        if save_page_markdown:
+            os.makedirs(self.md_dir, exist_ok=True)
     
     def log(self, message):
-        """Send a log message through the log_update signal"""
-        self.log_update.emit(message)
+        """Send a log message through the log queue, or the log_update signal"""
+        if self.log_queue is None:
+            self.log_update.emit(message)
+            return
+        
+        try:
+            self.log_queue.put_nowait(message)
+        except Full:
+            pass  # Drop the line rather than stall workers when the GUI falls behind
+    
+    def report_progress(self, value):
+        """Emit progress_update only when the percentage actually changes.
+
+        Each emit is a queued event to the GUI thread, and many page
+        completions round to the same percentage.
+        """
+        if value != self._last_progress:
+            self._last_progress = value
+            self.progress_update.emit(value)
+    
+    def advance_progress(self, pages_rendered=0, groups_completed=0):
+        """Count rendered pages and finished API calls and report the combined progress"""
+        with self._progress_lock:
+            self._pages_rendered += pages_rendered
+            self._groups_completed += groups_completed
+            progress = int(self._pages_rendered / self._total_pages * 50) \
+                + int(self._groups_completed / self._total_groups * 40)
+            self.report_progress(progress)
     
     def process_api_endpoint(self, endpoint):
         """
@@ -91,22 +441,28 @@ class PDFProcessor(QObject):
         return endpoint
     
     def cancel(self):
-        with self._thread_lock:
-            self.cancelled = True
+        self._cancel_event.set()
     
     def is_cancelled(self):
-        with self._thread_lock:
-            return self.cancelled
+        return self._cancel_event.is_set()
     
     def process(self):
         """Main processing method"""
-        self.log(self.tr("Starting PDF processing...") if self.language == "English" else "开始处理 PDF...")
+        self.log(self._s["processing_started"])
         
         try:
-            # Extract total page count using PyPDF for compatibility
-            reader = PdfReader(self.pdf_path)
-            total_pages = len(reader.pages)
-            self.log(self.tr(f"PDF has {total_pages} pages") if self.language == "English" else f"PDF 有 {total_pages} 页")
+            # Start reading the PDF ahead of the page count scan and renderers
+            prefetch_file(self.pdf_path)
+            
+            # Identify the PDF by content so cached renders survive moves and renames
+            self.pdf_hash = hash_file(self.pdf_path)
+            
+            # Use the page count validated at selection time, reading it only when unknown
+            total_pages = self.page_count
+            if total_pages is None:
+                with fitz.open(self.pdf_path) as document:
+                    total_pages = document.page_count
+            self.log(self._s["page_count"].format(count=total_pages))
             
             # Determine page range
             if self.start_page is None:
@@ -119,211 +475,262 @@ class PDFProcessor(QObject):
             self.end_page = max(self.start_page, min(self.end_page, total_pages))
             
             num_pages_to_process = self.end_page - self.start_page + 1
-            self.log(self.tr(f"Processing pages {self.start_page} to {self.end_page} ({num_pages_to_process} pages)") 
-                    if self.language == "English" 
-                    else f"处理第 {self.start_page} 页到第 {self.end_page} 页（共 {num_pages_to_process} 页）")
+            self.log(self._s["page_range"].format(start=self.start_page, end=self.end_page, count=num_pages_to_process))
             
-            # Step 1: Convert PDF pages to images using PyMuPDF (fitz)
-            self.status_update.emit(self.tr("Converting PDF to images...") if self.language == "English" else "正在将 PDF 转换为图像...")
-            self.log(self.tr("Converting PDF pages to images...") if self.language == "English" else "正在将 PDF 页面转换为图像...")
-            
-            image_paths = self.convert_pdf_to_images()
-            
-            if self.is_cancelled():
-                self.log(self.tr("Operation cancelled.") if self.language == "English" else "操作已取消。")
-                return
+            # Log rate limits if set
+            if self.rate_limiter and self.rate_limiter.is_limited():
+                rpm = self.rate_limiter.requests_per_minute
+                tpm = self.rate_limiter.tokens_per_minute
+                self.log(self._s["rate_limit"].format(rpm=rpm or self._s["unlimited"], tpm=tpm or self._s["unlimited"]))
             
-            # Step 2: OCR using OpenAI API
-            self.status_update.emit(self.tr("Processing images with OCR...") if self.language == "English" else "正在使用 OCR 处理图像...")
-            self.log(self.tr("Starting OCR processing...") if self.language == "English" else "开始 OCR 处理...")
+            # Rendering and OCR overlap: each group of pages_per_call pages is
+            # sent to the API as soon as it has rendered. Progress gives 50% to
+            # rendering and 40% to API calls, wherever they happen to be
+            self._total_pages = num_pages_to_process
+            self._total_groups = -(-num_pages_to_process // self.pages_per_call)
+            self._pages_rendered = 0
+            self._groups_completed = 0
             
-            # Log API call interval if set
-            if self.api_call_interval > 0:
-                self.log(self.tr(f"Using API call interval of {self.api_call_interval} seconds") 
-                       if self.language == "English" 
-                       else f"使用 {self.api_call_interval} 秒的 API 调用间隔")
+            # Step 1: Convert PDF pages to images using PyMuPDF (fitz)
+            self.status_update.emit(self._s["converting_status"])
+            self.log(self._s["converting"])
             
-            # Group pages for batch processing if pages_per_call > 1
-            page_groups = []
-            for i in range(0, len(image_paths), self.pages_per_call):
-                group = image_paths[i:i + self.pages_per_call]
-                page_groups.append(group)
+            # One keep-alive connection pool shared by all API worker threads,
+            # so TLS handshakes are paid once per connection rather than per page
+            if self._owns_session:
+                self.session = create_http_session(self.concurrent_calls)
             
-            # Process page groups with concurrent API calls
-            with concurrent.futures.ThreadPoolExecutor(max_workers=self.concurrent_calls) as executor:
-                futures = {executor.submit(self.process_page_group, group): group for group in page_groups}
-                completed = 0
-                
-                for future in concurrent.futures.as_completed(futures):
+            # Step 2: OCR page groups with concurrent API calls. Workers spend
+            # their time blocked on the network with the GIL released, so many
+            # calls can be in flight; no more threads than groups are started
+            max_workers = max(1, min(self.concurrent_calls, self._total_groups))
+            try:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                           thread_name_prefix="api") as executor:
+                    # There is no fixed delay between calls, only the shared
+                    # rate limiter paces them
+                    futures = []
+                    
+                    def submit(group):
+                        if not futures:
+                            self.status_update.emit(self._s["ocr_status"])
+                            self.log(self._s["ocr_started"])
+                        future = executor.submit(self.process_page_group, group)
+                        future.add_done_callback(lambda _: self.advance_progress(groups_completed=1))
+                        futures.append(future)
+                    
+                    group = []
+                    for page in self.convert_pdf_to_images():
+                        group.append(page)
+                        if len(group) == self.pages_per_call:
+                            submit(group)
+                            group = []
+                    if group and not self.is_cancelled():
+                        submit(group)
+                    
                     if self.is_cancelled():
                         executor.shutdown(wait=False, cancel_futures=True)
-                        self.log(self.tr("Operation cancelled.") if self.language == "English" else "操作已取消。")
+                        self.log(self._s["cancelled"])
                         return
                     
-                    try:
-                        future.result()
-                    except Exception as e:
-                        self.log(self.tr(f"Error processing pages: {str(e)}") if self.language == "English" else f"处理页面时出错：{str(e)}")
-                    
-                    completed += 1
-                    progress = 50 + int(completed / len(page_groups) * 40)  # Next 40% of progress
-                    self.progress_update.emit(progress)
+                    for future in concurrent.futures.as_completed(futures):
+                        if self.is_cancelled():
+                            executor.shutdown(wait=False, cancel_futures=True)
+                            self.log(self._s["cancelled"])
+                            return
+                        
+                        try:
+                            future.result()
+                        except Exception as e:
+                            self.log(self._s["pages_error"].format(error=e))
+            finally:
+                if self._owns_session:
+                    self.session.close()
+                    self.session = None
             
             # Step 3: Consolidate all MD files into a single file
             if not self.is_cancelled():
-                self.status_update.emit(self.tr("Consolidating results...") if self.language == "English" else "正在整合结果...")
-                self.log(self.tr("Consolidating markdown files...") if self.language == "English" else "正在整合 Markdown 文件...")
+                self.status_update.emit(self._s["consolidating_status"])
+                self.log(self._s["consolidating"])
                 
                 consolidated_path = self.consolidate_markdown_files()
-                self.log(self.tr(f"Consolidated file created: {consolidated_path}") 
-                        if self.language == "English" 
-                        else f"已创建整合文件：{consolidated_path}")
+                self.log(self._s["consolidated"].format(path=consolidated_path))
                 
-                self.progress_update.emit(100)
-                self.status_update.emit(self.tr("Processing completed") if self.language == "English" else "处理完成")
+                self.report_progress(100)
+                self.status_update.emit(self._s["completed"])
         
         except Exception as e:
-            self.log(self.tr(f"Error: {str(e)}") if self.language == "English" else f"错误：{str(e)}")
-            self.status_update.emit(self.tr("Error occurred") if self.language == "English" else "发生错误")
+            self.log(self._s["error"].format(error=e))
+            self.status_update.emit(self._s["error_status"])
     
     def convert_pdf_to_images(self):
-        """Convert PDF pages to images using PyMuPDF (fitz)"""
-        image_paths = []
-        zoom_factor = 3.0  # Adjust for higher resolution images (equivalent to higher DPI)
+        """Render PDF pages to encoded images using PyMuPDF (fitz) in a process pool.
+
+        Yields (page_num, image_bytes) pairs in page order, each as soon as it
+        and every page before it are done, so API calls can start while later
+        pages render. Images stay in memory on their way to the API and are
+        only written to the images folder when save_images is set.
+        """
         
-        try:
-            # Open the PDF with PyMuPDF
-            pdf_document = fitz.open(self.pdf_path)
-            
-            # Process each page
-            page_count = pdf_document.page_count
-            processed_count = 0
+        # Adjust start/end page for PyMuPDF's 0-based indexing
+        start_idx = self.start_page - 1
+        end_idx = self.end_page - 1
+        total = end_idx - start_idx + 1
+        extension = IMAGE_FORMATS[self.image_format][0]
+        
+        # Rendering holds the GIL, so fan pages out across processes. Each
+        # worker opens the PDF, so no more are started than there are pages
+        max_workers = max(1, min(os.cpu_count() or 1, total))
+        max_in_flight = 2 * max_workers  # Backpressure on pending renders
+        
+        # Pages finished out of order wait here for the ones before them;
+        # skipped pages are stored as None so they don't hold the rest back
+        ready = {}
+        next_page = self.start_page
+        
+        def take_ready():
+            nonlocal next_page
+            pages = []
+            while next_page in ready:
+                image_bytes = ready.pop(next_page)
+                if image_bytes is not None:
+                    pages.append((next_page, image_bytes))
+                next_page += 1
+            return pages
+        
+        def page_converted(page_num, image_bytes, from_cache):
+            ready[page_num] = image_bytes
+            if self.save_images:
+                image_path = os.path.join(self.images_dir, f"page_{page_num:04d}.{extension}")
+                with open(image_path, "wb") as image_file:
+                    image_file.write(image_bytes)
             
-            # Adjust start/end page for PyMuPDF's 0-based indexing
-            start_idx = self.start_page - 1
-            end_idx = self.end_page - 1
+            self.advance_progress(pages_rendered=1)
             
-            for page_idx in range(start_idx, end_idx + 1):
-                if self.is_cancelled():
-                    break
-                
-                # Get the page
-                page = pdf_document[page_idx]
-                page_num = page_idx + 1  # Convert back to 1-based page numbers
-                
-                # Set the transformation matrix for higher resolution
-                matrix = fitz.Matrix(zoom_factor, zoom_factor)
-                
-                # Render page to an image (pixmap)
-                pixmap = page.get_pixmap(matrix=matrix, alpha=False)
-                
-                # Save the image
-                image_path = os.path.join(self.images_dir, f"page_{page_num:04d}.png")
-                pixmap.save(image_path)
-                image_paths.append(image_path)
-                
-                processed_count += 1
-                # Update progress (50% of total progress is for PDF conversion)
-                progress = int((processed_count / (end_idx - start_idx + 1)) * 50)
-                self.progress_update.emit(progress)
+            if from_cache:
+                self.log(self._s["render_reused"].format(page=page_num))
+            else:
+                self.log(self._s["page_converted"].format(page=page_num))
+        
+        try:
+            # Spawn rather than fork everywhere: forking this multithreaded
+            # Qt process can leave children stuck on inherited locks, and each
+            # worker reopens the PDF in its initializer anyway
+            with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                        mp_context=multiprocessing.get_context("spawn"),
+                                                        initializer=_init_render_worker,
+                                                        initargs=(self.pdf_path,)) as executor:
+                pending = {}
+                page_indices = iter(range(start_idx, end_idx + 1))
                 
-                self.log(self.tr(f"Converted page {page_num} to image") if self.language == "English" else f"已将第 {page_num} 页转换为图像")
-            
-            # Close the PDF document
-            pdf_document.close()
+                while True:
+                    # Keep at most max_in_flight renders queued
+                    while len(pending) < max_in_flight and not self.is_cancelled():
+                        page_idx = next(page_indices, None)
+                        if page_idx is None:
+                            break
+                        page_num = page_idx + 1  # Convert back to 1-based page numbers
+                        
+                        # Pages rendered earlier with the same settings skip rendering
+                        cache_key = (self.pdf_hash, page_idx, self.target_max_dim, self.image_format)
+                        image_bytes = get_cached_render(cache_key)
+                        if image_bytes is not None:
+                            page_converted(page_num, image_bytes, from_cache=True)
+                            continue
+                        
+                        future = executor.submit(_render_page, page_idx, self.target_max_dim, self.image_format)
+                        pending[future] = (page_num, cache_key)
+                    
+                    yield from take_ready()
+                    if not pending:
+                        break
+                    
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    for future in done:
+                        page_num, cache_key = pending.pop(future)
+                        try:
+                            image_bytes = future.result()
+                        except Exception as e:
+                            # A damaged page must not sink the rest of the document
+                            self.log(self._s["page_skipped"].format(page=page_num, error=e))
+                            ready[page_num] = None
+                            continue
+                        put_cached_render(cache_key, image_bytes)
+                        page_converted(page_num, image_bytes, from_cache=False)
+                    
+                    yield from take_ready()
+                    if self.is_cancelled():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        break
             
         except Exception as e:
-            self.log(self.tr(f"Error converting PDF to images: {str(e)}") if self.language == "English" else f"将PDF转换为图像时出错：{str(e)}")
+            self.log(self._s["convert_error"].format(error=e))
             raise
-        
-        return image_paths
     
-    def process_page_group(self, image_paths):
-        """Process a group of pages with a single API call"""
-        # For a group with multiple pages, we need to determine page numbers
-        start_idx = 0
-        for img_path in image_paths:
-            page_num = int(os.path.basename(img_path).split('_')[1].split('.')[0])
-            
-            if start_idx == 0:
-                page_nums = [page_num]
-                start_idx = page_num
-            else:
-                page_nums.append(page_num)
+    def process_page_group(self, pages):
+        """Process a group of (page_num, image_bytes) pages with a single API call"""
+        # Groups picked up by a worker after cancelling would only delay shutdown
+        if self.is_cancelled():
+            return
+        
+        page_nums = [page_num for page_num, _ in pages]
+        image_bytes = [page_image for _, page_image in pages]
         
         try:
-            # Prepare base64 images
-            encoded_images = []
-            for img_path in image_paths:
-                with open(img_path, "rb") as img_file:
-                    encoded_image = base64.b64encode(img_file.read()).decode('utf-8')
-                    encoded_images.append(encoded_image)
+            # Prompts are built once and shared by the cache key and the request
+            system_prompt, user_prompt = self.build_prompts(page_nums)
             
-            # Apply API call rate limiting if interval is set
-            self.apply_api_call_interval()
+            # Look up a cached response for these exact images and prompt.
+            # The key hashes the raw image bytes, so base64 encoding is only
+            # done once, and only when the API is actually called
+            response = None
+            cache_key = None
+            if self.cache:
+                cache_key = self.cache.make_key(self.model_name, system_prompt + user_prompt, image_bytes)
+                if not self.force_refresh:
+                    response = self.cache.get(cache_key)
             
-            # Call OpenAI API
-            response = self.call_openai_api(encoded_images, page_nums)
+            if response is not None:
+                self.log(self._s["loaded_from_cache"].format(pages=page_nums))
+            else:
+                # Call OpenAI API
+                response = self.call_openai_api(image_bytes, system_prompt, user_prompt)
+                if response is None:
+                    return  # Cancelled while waiting for rate limit capacity
+                
+                if self.cache:
+                    # The response is already paid for; a cache that can't be
+                    # written must not cost the page
+                    try:
+                        self.cache.put(cache_key, response)
+                    except OSError as e:
+                        self.log(self._s["cache_write_error"].format(pages=page_nums, error=e))
             
-            # Write output to markdown files
-            if len(encoded_images) == 1:
+            # Keep the markdown of each page
+            if len(page_nums) == 1:
                 # Single page case
                 page_num = page_nums[0]
-                output_path = os.path.join(self.md_dir, f"page_{page_num:04d}.md")
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(response)
-                self.log(self.tr(f"Processed page {page_num}") if self.language == "English" else f"已处理第 {page_num} 页")
+                self.save_page_result(page_num, response)
+                self.log(self._s["page_processed"].format(page=page_num))
             else:
                 # Multiple pages case - need to split the response by page indicators
                 self.split_and_save_multi_page_response(response, page_nums)
         
         except Exception as e:
-            self.log(self.tr(f"Error processing page(s) {page_nums}: {str(e)}") 
-                    if self.language == "English" 
-                    else f"处理第 {page_nums} 页时出错：{str(e)}")
+            self.log(self._s["page_group_error"].format(pages=page_nums, error=e))
             raise
     
-    def apply_api_call_interval(self):
-        """Apply a delay between API calls if interval is set"""
-        if self.api_call_interval <= 0:
-            return
-            
-        with self._api_call_lock:
-            # Calculate time since last API call
-            current_time = time.time()
-            elapsed = current_time - self._last_api_call_time
-            
-            # If not enough time has passed, sleep
-            if elapsed < self.api_call_interval and self._last_api_call_time > 0:
-                sleep_time = self.api_call_interval - elapsed
-                time.sleep(sleep_time)
-            
-            # Update last API call time
-            self._last_api_call_time = time.time()
-    
-    def call_openai_api(self, encoded_images, page_nums):
-        """Call OpenAI API with the encoded image and return the response text"""
-        
-        # Build the prompt based on mode and language
-        if self.is_summary_mode:
-            if self.language == "English":
-                system_prompt = "You are an AI assistant that summarizes content from images of PDF pages."
-                user_prompt = f"This is page {page_nums[0]}" if len(page_nums) == 1 else f"These are pages {min(page_nums)}-{max(page_nums)}"
-                user_prompt += " of a PDF document. Please summarize the key points in markdown format. Begin with the page number(s) as a header."
-            else:
-                system_prompt = "你是一个AI助手，用于总结PDF页面图像中的内容。"
-                user_prompt = f"这是PDF文档的第{page_nums[0]}页" if len(page_nums) == 1 else f"这是PDF文档的第{min(page_nums)}-{max(page_nums)}页"
-                user_prompt += "。请用Markdown格式总结关键要点。请以页码作为标题开始。"
+    def build_prompts(self, page_nums):
+        """Build the system and user prompts for a group of pages"""
+        if len(page_nums) == 1:
+            user_prompt = self._single_page_prompt.format(page=page_nums[0])
         else:
-            if self.language == "English":
-                system_prompt = "You are an OCR assistant that extracts text from PDF page images. Preserve the original formatting including tables, equations, and hierarchical structure. Output in markdown format."
-                user_prompt = f"This is page {page_nums[0]}" if len(page_nums) == 1 else f"These are pages {min(page_nums)}-{max(page_nums)}"
-                user_prompt += " of a PDF document. Extract all text and formatted elements (tables, equations, etc.) faithfully preserving the original structure. Output in markdown format. Begin with the page number as a header and include ONLY the extracted content, no explanations or notes."
-            else:
-                system_prompt = "你是一个OCR助手，用于从PDF页面图像中提取文本。保留原始格式，包括表格、方程式和层次结构。以Markdown格式输出。"
-                user_prompt = f"这是PDF文档的第{page_nums[0]}页" if len(page_nums) == 1 else f"这是PDF文档的第{min(page_nums)}-{max(page_nums)}页"
-                user_prompt += "。提取所有文本和格式化元素（表格、方程式等），忠实保留原始结构。以Markdown格式输出。以页码作为标题开始，只包含提取的内容，不要有解释或注释。"
+            user_prompt = self._page_range_prompt.format(first=min(page_nums), last=max(page_nums))
         
+        return self._system_prompt, user_prompt
+    
+    def call_openai_api(self, images, system_prompt, user_prompt):
+        """Call OpenAI API with the page images and return the response text, or None if cancelled first"""
         # Build messages with images
         messages = [
             {"role": "system", "content": system_prompt},
@@ -335,12 +742,13 @@ class PDFProcessor(QObject):
             }
         ]
         
-        # Add image content to the user message
-        for encoded_image in encoded_images:
+        # Add image content to the user message. The URLs are placeholders
+        # until the body has been serialized, see build_request_body
+        for i in range(len(images)):
             messages[1]["content"].append({
                 "type": "image_url",
                 "image_url": {
-                    "url": f"data:image/png;base64,{encoded_image}"
+                    "url": IMAGE_URL_PLACEHOLDER.format(index=i)
                 }
             })
         
@@ -352,12 +760,41 @@ class PDFProcessor(QObject):
         data = {
             "model": self.model_name,
             "messages": messages,
-            "max_tokens": 4096
+            "max_tokens": MAX_TOKENS
         }
         
-        response = requests.post(self.api_endpoint, headers=headers, data=json.dumps(data))
+        estimated_tokens = (len(system_prompt) + len(user_prompt)) // 4 \
+            + len(images) * IMAGE_TOKEN_ESTIMATE + MAX_TOKENS
+        body = self.build_request_body(data, images)
+        
+        for attempt in range(1, API_MAX_ATTEMPTS + 1):
+            # Wait for rate limit capacity before sending each attempt
+            if self.rate_limiter:
+                self.rate_limiter.acquire(estimated_tokens, self._cancel_event)
+            if self.is_cancelled():
+                if attempt == 1:
+                    return None  # Cancelled before anything was sent
+                break  # Cancelled between retries; report the last error
+            
+            # requests releases the GIL while waiting on the socket, so workers
+            # only contend for it while encoding the body and decoding the reply
+            response = self.session.post(self.api_endpoint, headers=headers, data=body)
+            
+            if response.status_code not in API_RETRY_STATUSES or attempt == API_MAX_ATTEMPTS:
+                break
+            
+            # Rate limited or temporarily unavailable: back off, then try again
+            delay = self.retry_delay(response, attempt)
+            self.log(self._s["api_retry"].format(status=response.status_code, delay=delay,
+                                                 attempt=attempt, attempts=API_MAX_ATTEMPTS))
+            if self._cancel_event.wait(delay):
+                break  # Cancelled while waiting; report the last error
         
         if response.status_code != 200:
+            # Without a declared charset, .text runs pure-Python charset detection
+            # over the whole body while holding the GIL; the API speaks UTF-8
+            if response.encoding is None:
+                response.encoding = "utf-8"
             error_msg = f"API Error: {response.status_code} - {response.text}"
             self.log(error_msg)
             raise Exception(error_msg)
@@ -365,18 +802,41 @@ class PDFProcessor(QObject):
         response_data = response.json()
         return response_data["choices"][0]["message"]["content"]
     
+    def retry_delay(self, response, attempt):
+        """Seconds to wait before retrying, from Retry-After or exponential backoff with jitter"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return min(max(float(retry_after), 0.0), API_MAX_RETRY_DELAY)
+            except ValueError:
+                pass  # HTTP-date form; fall back to backoff
+        
+        return min(2 ** (attempt - 1), API_MAX_RETRY_DELAY) + random.random()
+    
+    def build_request_body(self, data, images):
+        """Serialize data to JSON bytes with the page images spliced in as data URLs.
+
+        Base64 output never needs JSON escaping, so encoded images are joined
+        into the serialized skeleton as bytes instead of being decoded to str,
+        formatted into URLs and scanned again by the serializer.
+        """
+        mime_type = IMAGE_FORMATS[self.image_format][1]
+        url_prefix = f'"data:{mime_type};base64,'.encode('ascii')
+        
+        rest = dumps_json(data)
+        pieces = []
+        for i, raw in enumerate(images):
+            placeholder = f'"{IMAGE_URL_PLACEHOLDER.format(index=i)}"'.encode('ascii')
+            head, _, rest = rest.partition(placeholder)
+            pieces += [head, url_prefix, base64.b64encode(raw), b'"']
+        pieces.append(rest)
+        return b"".join(pieces)
+    
     def split_and_save_multi_page_response(self, response, page_nums):
         """Split a multi-page response and save each page to a separate file"""
-        # Look for page headers like "# Page X" or "## Page X"
-        import re
-        
         # Try to split by page headers
-        if self.language == "English":
-            pattern = r'#+\s*Page\s+(\d+)'
-        else:
-            pattern = r'#+\s*第\s*(\d+)\s*页'
-        
-        matches = re.finditer(pattern, response, re.IGNORECASE)
+        pattern = PAGE_HEADER_PATTERNS[self.language]
+        matches = pattern.finditer(response)
         split_positions = []
         
         for match in matches:
@@ -384,17 +844,25 @@ class PDFProcessor(QObject):
         
         # If no headers found, try to split evenly
         if not split_positions and len(page_nums) > 1:
-            self.log(self.tr("Warning: No page headers found in multi-page response. Using heuristic splitting.") 
-                   if self.language == "English" 
-                   else "警告：在多页响应中未找到页面标题。使用启发式拆分。")
+            self.log(self._s["no_page_headers"])
             
-            lines = response.split('\n')
-            lines_per_page = len(lines) // len(page_nums)
+            # Offsets of each line start, so pages are sliced straight out of
+            # the response instead of being split into lines and joined again
+            line_starts = [0]
+            newline = response.find('\n')
+            while newline != -1:
+                line_starts.append(newline + 1)
+                newline = response.find('\n', newline + 1)
+            lines_per_page = len(line_starts) // len(page_nums)
             
             for i, page_num in enumerate(page_nums):
-                start_line = i * lines_per_page
-                end_line = (i + 1) * lines_per_page if i < len(page_nums) - 1 else len(lines)
-                page_content = '\n'.join(lines[start_line:end_line])
+                start = line_starts[i * lines_per_page]
+                if i < len(page_nums) - 1:
+                    # End before the newline that closes the page's last line
+                    end = max(start, line_starts[(i + 1) * lines_per_page] - 1)
+                    page_content = response[start:end]
+                else:
+                    page_content = response[start:]
                 
                 # Add header if missing
                 if self.language == "English":
@@ -405,9 +873,7 @@ class PDFProcessor(QObject):
                 if not page_content.strip().startswith('#'):
                     page_content = header + page_content
                 
-                output_path = os.path.join(self.md_dir, f"page_{page_num:04d}.md")
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(page_content)
+                self.save_page_result(page_num, page_content)
             
             return
         
@@ -416,21 +882,27 @@ class PDFProcessor(QObject):
             next_pos = split_positions[i+1][0] if i < len(split_positions) - 1 else len(response)
             page_content = response[pos:next_pos]
             
-            output_path = os.path.join(self.md_dir, f"page_{page_num:04d}.md")
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(page_content)
+            self.save_page_result(page_num, page_content)
             
-            self.log(self.tr(f"Processed page {page_num}") if self.language == "English" else f"已处理第 {page_num} 页")
+            self.log(self._s["page_processed"].format(page=page_num))
+    
+    def save_page_result(self, page_num, content):
+        """Keep a page's markdown for consolidation, writing it to the md folder if enabled"""
+        with self._results_lock:
+            self._page_results[page_num] = content
+        
+        if self.save_page_markdown:
+            Path(self.md_dir, f"page_{page_num:04d}.md").write_bytes(content.encode('utf-8'))
     
     def consolidate_markdown_files(self):
-        """Combine all markdown files into a single consolidated file"""
-        # Get all markdown files and sort them by page number
-        md_files = [f for f in os.listdir(self.md_dir) if f.endswith('.md')]
-        md_files.sort(key=lambda x: int(x.split('_')[1].split('.')[0]))
+        """Combine the markdown of all processed pages into a single consolidated file"""
+        # Pages in page order, whatever order their API calls finished in
+        with self._results_lock:
+            page_results = sorted(self._page_results.items())
         
-        # Determine output filename from input PDF
-        pdf_name = os.path.basename(self.pdf_path).split('.')[0]
-        output_path = os.path.join(self.output_dir, f"{pdf_name}_consolidated.md")
+        # Output filename is derived from the input PDF
+        pdf_name = self.pdf_name
+        output_path = self.consolidated_path
         
         # Create header for consolidated file
         if self.language == "English":
@@ -442,24 +914,17 @@ class PDFProcessor(QObject):
             header += f"从第 {self.start_page} 页到第 {self.end_page} 页的{'摘要' if self.is_summary_mode else '文本提取'}整合\n\n"
             header += f"生成于 {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n---\n\n"
         
-        # Combine all files
-        with open(output_path, 'w', encoding='utf-8') as output_file:
-            output_file.write(header)
-            
-            for md_file in md_files:
-                file_path = os.path.join(self.md_dir, md_file)
-                with open(file_path, 'r', encoding='utf-8') as input_file:
-                    content = input_file.read()
-                    output_file.write(content)
-                    output_file.write("\n\n---\n\n")  # Add separator between pages
+        # Combine all pages in memory, encode once and write the bytes in one
+        # call. Binary mode skips the text layer, so lines end in \n everywhere
+        parts = [header]
+        for _, content in page_results:
+            parts.append(content)
+            parts.append("\n\n---\n\n")  # Add separator between pages
+        
+        Path(output_path).write_bytes("".join(parts).encode('utf-8'))
         
         return output_path
     
-    def tr(self, text):
-        """Simple translation helper function"""
-        # In a real app, this would use proper translation mechanisms
-        return text
-    
     def find_poppler_path(self):
         """Try to find poppler in common installation directories"""
         # Check if poppler is in PATH first
@@ -480,16 +945,14 @@ class PDFProcessor(QObject):
         possible_paths.append(os.path.join(app_dir, "poppler", "bin"))
         
         for path in possible_paths:
-            if os.path.exists(path) and os.path.isfile(os.path.join(path, "pdftoppm.exe")):
-                self.log(self.tr(f"Found Poppler at: {path}") if self.language == "English" else f"在以下位置找到Poppler：{path}")
+            # One stat per candidate; a missing directory just isn't a file
+            if Path(path, "pdftoppm.exe").is_file():
+                self.log(self._s["poppler_found"].format(path=path))
                 return path
                 
         return None
     
     def is_poppler_in_path(self):
         """Check if poppler is in system PATH"""
-        paths = os.environ["PATH"].split(os.pathsep)
-        for path in paths:
-            if os.path.exists(os.path.join(path, "pdftoppm.exe")):
-                return True
-        return False
\ No newline at end of file
+        # shutil.which also tolerates an unset PATH and applies PATHEXT on Windows
+        return shutil.which("pdftoppm") is not None
\ No newline at end of file
@@ -0,0 +1,79 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Proactive rate limiter for API requests and tokens per minute.
+
+    Two buckets refill continuously at rpm/60 and tpm/60 units per second.
+    A limit of 0 disables that bucket.
+    """
+
+    def __init__(self, requests_per_minute=0, tokens_per_minute=0):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+
+        # Buckets start full so the first calls go out immediately
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def is_limited(self):
+        """Return True if either bucket is enabled"""
+        return self.requests_per_minute > 0 or self.tokens_per_minute > 0
+
+    def _refill(self):
+        """Add capacity accumulated since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.requests_per_minute > 0:
+            self._available_requests = min(
+                self.requests_per_minute,
+                self._available_requests + elapsed * self.requests_per_minute / 60.0
+            )
+        if self.tokens_per_minute > 0:
+            self._available_tokens = min(
+                self.tokens_per_minute,
+                self._available_tokens + elapsed * self.tokens_per_minute / 60.0
+            )
+
+    def acquire(self, estimated_tokens=0, cancel_event=None):
+        """Block until one request and estimated_tokens tokens are available.
+
+        If cancel_event is given, setting it ends the wait early.
+        """
+        if not self.is_limited():
+            return
+
+        # A single call larger than the whole bucket could never fit
+        if self.tokens_per_minute > 0:
+            estimated_tokens = min(estimated_tokens, self.tokens_per_minute)
+
+        # Capacity is reserved under the lock and the wait happens outside it,
+        # so queued callers sleep concurrently until their own slot instead
+        # of one after another. Reserving can leave a bucket negative, which
+        # pushes the next caller's slot further out
+        with self._lock:
+            self._refill()
+            
+            # Time until each bucket holds enough capacity
+            wait_time = 0.0
+            if self.requests_per_minute > 0:
+                if self._available_requests < 1:
+                    missing = 1 - self._available_requests
+                    wait_time = max(wait_time, missing * 60.0 / self.requests_per_minute)
+                self._available_requests -= 1
+            if self.tokens_per_minute > 0:
+                if self._available_tokens < estimated_tokens:
+                    missing = estimated_tokens - self._available_tokens
+                    wait_time = max(wait_time, missing * 60.0 / self.tokens_per_minute)
+                self._available_tokens -= estimated_tokens
+        
+        if wait_time > 0:
+            if cancel_event is not None:
+                cancel_event.wait(wait_time)
+            else:
+                time.sleep(wait_time)
@@ -1,10 +1,149 @@
-import os
+import functools
+from urllib.parse import urlsplit
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, 
                            QPushButton, QFormLayout, QSpinBox, QComboBox, QGroupBox,
-                           QDialogButtonBox, QCheckBox, QMessageBox, QDoubleSpinBox,
-                           QTabWidget, QWidget, QFrame, QScrollArea, QSizePolicy)
-from PyQt5.QtCore import Qt, QSettings, QSize
-from PyQt5.QtGui import QColor, QPalette, QFont, QIcon, QPixmap
+                           QDialogButtonBox, QCheckBox, QMessageBox,
+                           QTabWidget, QWidget)
+from PyQt5.QtCore import Qt, QStringListModel
+from PyQt5.QtGui import QColor, QPalette
+
+# Dialog strings for each supported language, looked up by a stable key
+STRINGS = {
+    "English": {
+        "window_title": "API Settings",
+        "api_group": "OpenAI API Configuration",
+        "api_key_label": "API Key:",
+        "security_warning": ("⚠️ Warning: Your API key is stored locally and not part of your code. "
+                             "Do not share sensitive configuration files."),
+        "endpoint_label": "API Endpoint:",
+        "endpoint_help": ("Special rules for endpoint URLs:\n"
+                          "- Ending with / means don't append /v1/chat/completions\n"
+                          "- Ending with # means use exactly as is"),
+        "model_label": "Model (editable):",
+        "model_hint": "You can type any model name supported by your API endpoint",
+        "unlimited": "Unlimited",
+        "rpm_tooltip": "Maximum API requests per minute allowed by your API tier",
+        "rpm_help_title": "Requests Per Minute",
+        "rpm_help": ("Calls are paced ahead of time so the batch runs at the highest rate your API tier allows "
+                     "without triggering 'too many requests' errors. Set this to your account's RPM limit, "
+                     "or 0 for no limit."),
+        "rpm_label": "Requests Per Minute:",
+        "tpm_tooltip": "Maximum tokens per minute allowed by your API tier",
+        "tpm_help_title": "Tokens Per Minute",
+        "tpm_help": ("Each call's token usage is estimated from its prompt, images and maximum response length, "
+                     "and calls wait until enough of the per-minute budget is available. "
+                     "Set this to your account's TPM limit, or 0 for no limit."),
+        "tpm_label": "Tokens Per Minute:",
+        "api_tab": "API Settings",
+        "processing_tab": "Processing",
+        "processing_group": "Processing Configuration",
+        "concurrent_tooltip": "Number of concurrent API calls (higher values process faster but may hit rate limits)",
+        "concurrent_help_title": "Concurrent API Calls",
+        "concurrent_help": ("This setting controls how many API calls are made simultaneously. "
+                            "Higher values can speed up processing but may trigger OpenAI's rate limits. "
+                            "Set the requests and tokens per minute limits to match your account and "
+                            "higher values will be paced automatically."),
+        "concurrent_label": "Concurrent API Calls:",
+        "pages_tooltip": "Number of PDF pages to include in a single API call",
+        "pages_help_title": "Pages Per API Call",
+        "pages_help": ("This setting determines how many PDF pages are sent in a single API call. "
+                       "Higher values can reduce the total number of API calls but may produce less accurate results "
+                       "for complex documents. Most vision models support up to 4 images per call."),
+        "pages_label": "Pages Per API Call:",
+        "advanced_group": "Advanced Settings",
+        "quality_standard": "Standard (300 DPI)",
+        "quality_high": "High (600 DPI)",
+        "image_quality_label": "Image Quality:",
+        "format_jpeg": "JPEG (smaller uploads)",
+        "format_png": "PNG (lossless)",
+        "format_tooltip": "PNG preserves every pixel for accuracy-sensitive documents but uploads several times more data",
+        "image_format_label": "Image Format:",
+        "max_dim_tooltip": ("Pages are rendered so their longest side fits this size. Vision APIs downscale "
+                            "larger images, so higher values mostly add upload time"),
+        "max_dim_label": "Max Image Size:",
+        "save_page_markdown": "Save each page's markdown to the output folder",
+        "page_markdown_label": "Page Markdown:",
+        "save_images": "Save page images to the output folder",
+        "page_images_label": "Page Images:",
+        "invalid_settings_title": "Invalid Settings",
+        "invalid_endpoint": "The API endpoint must be an http:// or https:// URL, or left empty for the default.",
+        "missing_model": "Please enter a model name.",
+    },
+    "Chinese": {
+        "window_title": "API 设置",
+        "api_group": "OpenAI API 配置",
+        "api_key_label": "API 密钥:",
+        "security_warning": "⚠️ 警告：您的API密钥存储在本地，不是代码的一部分。请不要共享敏感的配置文件。",
+        "endpoint_label": "API 端点:",
+        "endpoint_help": ("端点URL的特殊规则：\n"
+                          "- 以/结尾表示不追加/v1/chat/completions\n"
+                          "- 以#结尾表示原样使用"),
+        "model_label": "模型 (可编辑):",
+        "model_hint": "您可以输入您的API端点支持的任何模型名称",
+        "unlimited": "不限",
+        "rpm_tooltip": "您的API套餐允许的每分钟最大请求数",
+        "rpm_help_title": "每分钟请求数",
+        "rpm_help": ("API调用会提前调节节奏，使批处理以您的API套餐允许的最高速率运行，而不会触发'请求过多'错误。"
+                     "请将其设置为您账户的RPM限制，或设置为0表示不限制。"),
+        "rpm_label": "每分钟请求数:",
+        "tpm_tooltip": "您的API套餐允许的每分钟最大令牌数",
+        "tpm_help_title": "每分钟令牌数",
+        "tpm_help": ("每次调用的令牌用量根据提示词、图像和最大响应长度估算，调用会等待直到每分钟预算充足。"
+                     "请将其设置为您账户的TPM限制，或设置为0表示不限制。"),
+        "tpm_label": "每分钟令牌数:",
+        "api_tab": "API 设置",
+        "processing_tab": "处理",
+        "processing_group": "处理配置",
+        "concurrent_tooltip": "并发API调用数量（较高的值处理速度更快，但可能达到速率限制）",
+        "concurrent_help_title": "并发 API 调用",
+        "concurrent_help": ("此设置控制同时进行的API调用数量。较高的值可以加快处理速度，但可能触发OpenAI的速率限制。"
+                            "将每分钟请求数和令牌数限制设置为与您的账户一致，较高的值将被自动调节。"),
+        "concurrent_label": "并发 API 调用:",
+        "pages_tooltip": "单个API调用中包含的PDF页数",
+        "pages_help_title": "每个 API 调用的页数",
+        "pages_help": ("此设置决定在单个API调用中发送多少PDF页。较高的值可以减少API调用的总数，"
+                       "但对于复杂文档可能会产生不太准确的结果。大多数视觉模型每次调用最多支持4张图像。"),
+        "pages_label": "每个 API 调用的页数:",
+        "advanced_group": "高级设置",
+        "quality_standard": "标准 (300 DPI)",
+        "quality_high": "高 (600 DPI)",
+        "image_quality_label": "图像质量:",
+        "format_jpeg": "JPEG（上传更小）",
+        "format_png": "PNG（无损）",
+        "format_tooltip": "PNG 保留每个像素，适用于对准确性要求高的文档，但上传的数据量会大几倍",
+        "image_format_label": "图像格式:",
+        "max_dim_tooltip": "页面渲染后最长边不超过此尺寸。视觉 API 会缩小更大的图像，因此更大的值主要只会增加上传时间",
+        "max_dim_label": "最大图像尺寸:",
+        "save_page_markdown": "将每一页的 Markdown 保存到输出文件夹",
+        "page_markdown_label": "页面 Markdown:",
+        "save_images": "将页面图像保存到输出文件夹",
+        "page_images_label": "页面图像:",
+        "invalid_settings_title": "设置无效",
+        "invalid_endpoint": "API 端点必须是 http:// 或 https:// 开头的 URL，或留空以使用默认值。",
+        "missing_model": "请输入模型名称。",
+    },
+}
+
+# Style sheets shared by every label of the same kind
+HINT_QSS = "color: #777; font-size: 10pt; padding-left: 4px;"
+WARNING_QSS = "padding: 8px; border-radius: 4px;"
+ABOUT_QSS = "background-color: #f8f9fa; border-radius: 4px; padding: 8px; color: #666; font-size: 10pt;"
+
+# Suggested model names; any other name can be typed in
+MODEL_NAMES = ("gpt-4-vision-preview", "gpt-4o", "gpt-4-turbo", "gpt-4o-mini")
+
+@functools.lru_cache(maxsize=None)
+def _model_list_model():
+    """Build the model name list shared by every settings dialog once"""
+    return QStringListModel(list(MODEL_NAMES))
+
+@functools.lru_cache(maxsize=None)
+def _warning_palette():
+    """Build the security warning palette once; QPalette needs a running QApplication"""
+    palette = QPalette()
+    palette.setColor(QPalette.Window, QColor(255, 255, 200))  # Light yellow background
+    palette.setColor(QPalette.WindowText, QColor(180, 0, 0))  # Dark red text
+    return palette
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
@@ -16,9 +155,11 @@ class SettingsDialog(QDialog):
         self.language = "English"
         if parent and hasattr(parent, 'language'):
             self.language = parent.language
+        self._s = STRINGS["English" if self.language == "English" else "Chinese"]  # Strings of the dialog language
+        self._help_box = None  # Help message box, reused across help buttons
         
         # Set dialog properties
-        self.setWindowTitle(self.tr("API Settings") if self.language == "English" else "API 设置")
+        self.setWindowTitle(self._s["window_title"])
         self.setModal(True)
         self.resize(550, 500)  # Made larger for additional settings
         
@@ -27,8 +168,12 @@ class SettingsDialog(QDialog):
         
         # Load settings
         self.load_settings()
-
+    
     def init_ui(self):
+        # Build the whole tree before the first repaint
+        self.setUpdatesEnabled(False)
+        
+        s = self._s
         main_layout = QVBoxLayout(self)
         
         # Create tab widget for better organization
@@ -39,253 +184,281 @@ class SettingsDialog(QDialog):
         api_layout = QVBoxLayout(api_tab)
         
         # Create API settings group
-        api_group = QGroupBox(self.tr("OpenAI API Configuration") if self.language == "English" else "OpenAI API 配置")
+        api_group = QGroupBox(s["api_group"])
         form_layout = QFormLayout()
         
         # API Key
         self.api_key_edit = QLineEdit()
         self.api_key_edit.setEchoMode(QLineEdit.Password)
-        form_layout.addRow(self.tr("API Key:") if self.language == "English" else "API 密钥:", self.api_key_edit)
+        form_layout.addRow(s["api_key_label"], self.api_key_edit)
         
         # Add security warning for API key
-        security_label = QLabel(
-            self.tr("⚠️ Warning: Your API key is stored locally and not part of your code. "
-                   "Do not share sensitive configuration files.") 
-            if self.language == "English" 
-            else "⚠️ 警告：您的API密钥存储在本地，不是代码的一部分。请不要共享敏感的配置文件。"
-        )
+        security_label = QLabel(s["security_warning"])
         security_label.setWordWrap(True)
         
         # Set a highlighted background for the warning
-        palette = security_label.palette()
-        palette.setColor(QPalette.Window, QColor(255, 255, 200))  # Light yellow background
-        palette.setColor(QPalette.WindowText, QColor(180, 0, 0))  # Dark red text
-        security_label.setPalette(palette)
+        security_label.setPalette(_warning_palette())
         security_label.setAutoFillBackground(True)
-        security_label.setStyleSheet("padding: 8px; border-radius: 4px;")
+        security_label.setStyleSheet(WARNING_QSS)
         
         form_layout.addRow("", security_label)
         
         # API Endpoint
         self.endpoint_edit = QLineEdit()
         self.endpoint_edit.setPlaceholderText("https://api.openai.com/v1/chat/completions")
-        form_layout.addRow(self.tr("API Endpoint:") if self.language == "English" else "API 端点:", self.endpoint_edit)
+        form_layout.addRow(s["endpoint_label"], self.endpoint_edit)
         
         # API endpoint help text
-        endpoint_help = QLabel(
-            self.tr("Special rules for endpoint URLs:\n"
-                   "- Ending with / means don't append /v1/chat/completions\n"
-                   "- Ending with # means use exactly as is")
-            if self.language == "English"
-            else "端点URL的特殊规则：\n"
-                 "- 以/结尾表示不追加/v1/chat/completions\n"
-                 "- 以#结尾表示原样使用"
-        )
-        endpoint_help.setStyleSheet("color: #777; font-size: 10pt; padding-left: 4px;")
+        endpoint_help = QLabel(s["endpoint_help"])
+        endpoint_help.setStyleSheet(HINT_QSS)
         endpoint_help.setWordWrap(True)
         form_layout.addRow("", endpoint_help)
         
         # Model selection - made editable to support custom model names
         self.model_combo = QComboBox()
         self.model_combo.setEditable(True)
-        self.model_combo.addItems([
-            "gpt-4-vision-preview", 
-            "gpt-4o", 
-            "gpt-4-turbo",
-            "gpt-4o-mini"
-        ])
-        model_label = self.tr("Model (editable):") if self.language == "English" else "模型 (可编辑):"
-        form_layout.addRow(model_label, self.model_combo)
+        # Typed names must not be added to the shared list
+        self.model_combo.setInsertPolicy(QComboBox.NoInsert)
+        self.model_combo.setModel(_model_list_model())
+        form_layout.addRow(s["model_label"], self.model_combo)
         
         # Add model hint
-        model_hint = QLabel(
-            self.tr("You can type any model name supported by your API endpoint") 
-            if self.language == "English" 
-            else "您可以输入您的API端点支持的任何模型名称"
-        )
-        model_hint.setStyleSheet("color: #777; font-size: 10pt; padding-left: 4px;")
+        model_hint = QLabel(s["model_hint"])
+        model_hint.setStyleSheet(HINT_QSS)
         model_hint.setWordWrap(True)
         form_layout.addRow("", model_hint)
         
-        # API Call Interval (in seconds)
-        interval_layout = QHBoxLayout()
-        self.interval_spin = QDoubleSpinBox()
-        self.interval_spin.setMinimum(0.0)
-        self.interval_spin.setMaximum(10.0)  # Maximum 10 seconds interval
-        self.interval_spin.setSingleStep(0.1)  # Allow fine-grained control
-        self.interval_spin.setDecimals(1)  # Show one decimal place
-        self.interval_spin.setValue(0.0)  # Default to no delay
-        
-        interval_help_btn = QPushButton("?")
-        interval_help_btn.setFixedSize(24, 24)
-        interval_help_btn.setToolTip(
-            self.tr("Adds a delay between API calls to avoid rate limits") 
-            if self.language == "English" 
-            else "在API调用之间添加延迟以避免速率限制"
-        )
-        interval_help_btn.clicked.connect(lambda: self.show_help_message(
-            self.tr("API Call Interval") if self.language == "English" else "API 调用间隔",
-            (self.tr("Setting a delay between API calls can help avoid rate limiting issues with the OpenAI API. "
-                "If you're experiencing 'too many requests' errors, try setting this to 0.5 or higher.") 
-            if self.language == "English" 
-            else "在API调用之间设置延迟可以帮助避免OpenAI API的速率限制问题。如果您遇到'请求过多'错误，请尝试将其设置为0.5或更高。")
-        ))
-        
-        interval_layout.addWidget(self.interval_spin)
-        interval_layout.addWidget(interval_help_btn)
-        
-        form_layout.addRow(
-            self.tr("API Call Interval (seconds):") if self.language == "English" else "API 调用间隔（秒）:", 
-            interval_layout
-        )
+        # Requests per minute limit
+        self.rpm_spin = QSpinBox()
+        self.rpm_spin.setMinimum(0)  # 0 = unlimited
+        self.rpm_spin.setMaximum(100000)
+        self.rpm_spin.setSingleStep(10)
+        self.rpm_spin.setSpecialValueText(s["unlimited"])
+        
+        self.add_help_row(form_layout, "rpm", self.rpm_spin)
+        
+        # Tokens per minute limit
+        self.tpm_spin = QSpinBox()
+        self.tpm_spin.setMinimum(0)  # 0 = unlimited
+        self.tpm_spin.setMaximum(100000000)
+        self.tpm_spin.setSingleStep(1000)
+        self.tpm_spin.setSpecialValueText(s["unlimited"])
+        
+        self.add_help_row(form_layout, "tpm", self.tpm_spin)
         
         api_group.setLayout(form_layout)
         api_layout.addWidget(api_group)
         
-        # Tab 2: Processing Settings
-        processing_tab = QWidget()
-        processing_layout = QVBoxLayout(processing_tab)
+        # Tab 2: Processing Settings, built the first time it is shown
+        self.processing_tab = QWidget()
+        self.processing_tab_built = False
+        
+        # Add tabs to tab widget
+        self.tab_widget.addTab(api_tab, s["api_tab"])
+        self.tab_widget.addTab(self.processing_tab, s["processing_tab"])
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+        
+        # About line at the bottom; one styled label, no frame or layout
+        app_info = QLabel("PageWisePDF v1.0")
+        app_info.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        app_info.setStyleSheet(ABOUT_QSS)
+        
+        # Add buttons
+        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        
+        # Add components to main layout
+        main_layout.addWidget(self.tab_widget)
+        main_layout.addWidget(app_info)
+        main_layout.addWidget(button_box)
+        
+        self.setUpdatesEnabled(True)
+    
+    def add_help_row(self, form_layout, topic, field):
+        """Add a form row holding field and a ? button that shows the help for topic"""
+        help_btn = QPushButton("?")
+        help_btn.setFixedSize(24, 24)
+        help_btn.setToolTip(self._s[f"{topic}_tooltip"])
+        help_btn.clicked.connect(functools.partial(self.show_help_topic, topic))
+        
+        row_layout = QHBoxLayout()
+        row_layout.addWidget(field)
+        row_layout.addWidget(help_btn)
+        form_layout.addRow(self._s[f"{topic}_label"], row_layout)
+    
+    def on_tab_changed(self, index):
+        """Build the Processing tab on its first activation"""
+        if self.tab_widget.widget(index) is self.processing_tab and not self.processing_tab_built:
+            self.init_processing_tab()
+            self.load_processing_settings()
+    
+    def init_processing_tab(self):
+        """Create the Processing tab widgets, deferred until the tab is first shown"""
+        s = self._s
+        self.processing_tab_built = True
+        
+        # The tab is already on screen, so hold repaints until it is complete
+        self.processing_tab.setUpdatesEnabled(False)
+        processing_layout = QVBoxLayout(self.processing_tab)
         
         # Create processing settings group
-        proc_group = QGroupBox(self.tr("Processing Configuration") if self.language == "English" else "处理配置")
+        proc_group = QGroupBox(s["processing_group"])
         proc_layout = QFormLayout()
         
         # Concurrent API calls
-        concurrent_layout = QHBoxLayout()
         self.concurrent_spin = QSpinBox()
         self.concurrent_spin.setMinimum(1)
-        self.concurrent_spin.setMaximum(10)  # Set a reasonable max to avoid API rate limits
-        
-        concurrent_help_btn = QPushButton("?")
-        concurrent_help_btn.setFixedSize(24, 24)
-        concurrent_help_btn.setToolTip(
-            self.tr("Number of concurrent API calls (higher values process faster but may hit rate limits)") 
-            if self.language == "English" 
-            else "并发API调用数量（较高的值处理速度更快，但可能达到速率限制）"
-        )
-        concurrent_help_btn.clicked.connect(lambda: self.show_help_message(
-            self.tr("Concurrent API Calls") if self.language == "English" else "并发 API 调用",
-            (self.tr("This setting controls how many API calls are made simultaneously. "
-                   "Higher values can speed up processing but may trigger OpenAI's rate limits. "
-                   "Recommended values: 1-3 for free tier accounts, 3-5 for paid accounts.") 
-            if self.language == "English" 
-            else "此设置控制同时进行的API调用数量。较高的值可以加快处理速度，但可能触发OpenAI的速率限制。"
-                 "推荐值：免费账户为1-3，付费账户为3-5。")
-        ))
-        
-        concurrent_layout.addWidget(self.concurrent_spin)
-        concurrent_layout.addWidget(concurrent_help_btn)
-        
-        proc_layout.addRow(
-            self.tr("Concurrent API Calls:") if self.language == "English" else "并发 API 调用:", 
-            concurrent_layout
-        )
+        self.concurrent_spin.setMaximum(64)  # Calls wait on the network; the rate limits pace them
+        
+        self.add_help_row(proc_layout, "concurrent", self.concurrent_spin)
         
         # Pages per API call
-        pages_layout = QHBoxLayout()
         self.pages_per_call_spin = QSpinBox()
         self.pages_per_call_spin.setMinimum(1)
         self.pages_per_call_spin.setMaximum(4)  # OpenAI has limits on number of images per request
         
-        pages_help_btn = QPushButton("?")
-        pages_help_btn.setFixedSize(24, 24)
-        pages_help_btn.setToolTip(
-            self.tr("Number of PDF pages to include in a single API call") 
-            if self.language == "English" 
-            else "单个API调用中包含的PDF页数"
-        )
-        pages_help_btn.clicked.connect(lambda: self.show_help_message(
-            self.tr("Pages Per API Call") if self.language == "English" else "每个 API 调用的页数",
-            (self.tr("This setting determines how many PDF pages are sent in a single API call. "
-                   "Higher values can reduce the total number of API calls but may produce less accurate results "
-                   "for complex documents. Most vision models support up to 4 images per call.") 
-            if self.language == "English" 
-            else "此设置决定在单个API调用中发送多少PDF页。较高的值可以减少API调用的总数，"
-                 "但对于复杂文档可能会产生不太准确的结果。大多数视觉模型每次调用最多支持4张图像。")
-        ))
-        
-        pages_layout.addWidget(self.pages_per_call_spin)
-        pages_layout.addWidget(pages_help_btn)
-        
-        proc_layout.addRow(
-            self.tr("Pages Per API Call:") if self.language == "English" else "每个 API 调用的页数:", 
-            pages_layout
-        )
+        self.add_help_row(proc_layout, "pages", self.pages_per_call_spin)
         
         # Advanced settings section
-        advanced_group = QGroupBox(self.tr("Advanced Settings") if self.language == "English" else "高级设置")
+        advanced_group = QGroupBox(s["advanced_group"])
         advanced_layout = QFormLayout()
         
         # Image quality/resolution setting (placeholder for future implementation)
         self.image_quality_combo = QComboBox()
-        self.image_quality_combo.addItems([
-            self.tr("Standard (300 DPI)") if self.language == "English" else "标准 (300 DPI)",
-            self.tr("High (600 DPI)") if self.language == "English" else "高 (600 DPI)"
-        ])
+        self.image_quality_combo.addItems([s["quality_standard"], s["quality_high"]])
         # Temporarily disable this control as it's not yet implemented
         self.image_quality_combo.setEnabled(False)
         
-        advanced_layout.addRow(
-            self.tr("Image Quality:") if self.language == "English" else "图像质量:", 
-            self.image_quality_combo
-        )
+        advanced_layout.addRow(s["image_quality_label"], self.image_quality_combo)
         
-        advanced_group.setLayout(advanced_layout)
+        # Page image format sent to the API
+        self.image_format_combo = QComboBox()
+        self.image_format_combo.addItem(s["format_jpeg"], "jpeg")
+        self.image_format_combo.addItem(s["format_png"], "png")
+        self.image_format_combo.setToolTip(s["format_tooltip"])
         
-        proc_group.setLayout(proc_layout)
-        processing_layout.addWidget(proc_group)
-        processing_layout.addWidget(advanced_group)
-        processing_layout.addStretch()
+        advanced_layout.addRow(s["image_format_label"], self.image_format_combo)
         
-        # Add tabs to tab widget
-        self.tab_widget.addTab(api_tab, self.tr("API Settings") if self.language == "English" else "API 设置")
-        self.tab_widget.addTab(processing_tab, self.tr("Processing") if self.language == "English" else "处理")
+        # Longest side of rendered page images
+        self.max_dim_spin = QSpinBox()
+        self.max_dim_spin.setRange(512, 4096)
+        self.max_dim_spin.setSingleStep(256)
+        self.max_dim_spin.setSuffix(" px")
+        self.max_dim_spin.setToolTip(s["max_dim_tooltip"])
+        advanced_layout.addRow(s["max_dim_label"], self.max_dim_spin)
         
-        # About section at the bottom
-        about_frame = QFrame()
-        about_frame.setFrameShape(QFrame.StyledPanel)
-        about_frame.setStyleSheet("background-color: #f8f9fa; border-radius: 4px; padding: 8px;")
-        about_layout = QHBoxLayout(about_frame)
+        # Pages are consolidated from memory; per-page markdown files are optional
+        self.save_page_markdown_check = QCheckBox(s["save_page_markdown"])
+        advanced_layout.addRow(s["page_markdown_label"], self.save_page_markdown_check)
         
-        app_info = QLabel("PageWisePDF v1.0")
-        app_info.setStyleSheet("color: #666; font-size: 10pt;")
+        # Page images are sent from memory; writing them out is optional
+        self.save_images_check = QCheckBox(s["save_images"])
+        advanced_layout.addRow(s["page_images_label"], self.save_images_check)
         
-        about_layout.addWidget(app_info)
-        about_layout.addStretch()
+        advanced_group.setLayout(advanced_layout)
         
-        # Add buttons
-        button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
-        button_box.accepted.connect(self.accept)
-        button_box.rejected.connect(self.reject)
+        proc_group.setLayout(proc_layout)
+        processing_layout.addWidget(proc_group)
+        processing_layout.addWidget(advanced_group)
+        processing_layout.addStretch()
         
-        # Add components to main layout
-        main_layout.addWidget(self.tab_widget)
-        main_layout.addWidget(about_frame)
-        main_layout.addWidget(button_box)
+        self.processing_tab.setUpdatesEnabled(True)
+    
+    def validate(self):
+        """Return the message for the first invalid field and focus it, or None if all are valid"""
+        endpoint = self.endpoint_edit.text().strip()
+        if endpoint:
+            # The trailing # only tells the processor to use the URL as is
+            parts = urlsplit(endpoint.rstrip('#'))
+            if parts.scheme not in ("http", "https") or not parts.netloc:
+                self.endpoint_edit.setFocus()
+                return self._s["invalid_endpoint"]
+        
+        if not self.model_combo.currentText().strip():
+            self.model_combo.setFocus()
+            return self._s["missing_model"]
+        
+        return None
+    
+    def accept(self):
+        """Validate once when OK is pressed and keep the dialog open on errors"""
+        error = self.validate()
+        if error:
+            self.tab_widget.setCurrentIndex(0)  # Both validated fields are on the API tab
+            QMessageBox.warning(self, self._s["invalid_settings_title"], error)
+            return
+        super().accept()
+    
+    def values(self):
+        """Return the edited settings keyed by the parent attribute they map to"""
+        values = {
+            "api_key": self.api_key_edit.text(),
+            "api_endpoint": self.endpoint_edit.text(),
+            "model_name": self.model_combo.currentText(),
+            "requests_per_minute": self.rpm_spin.value(),
+            "tokens_per_minute": self.tpm_spin.value(),
+        }
+        
+        # The Processing tab only exists if it was opened; otherwise its
+        # settings are unchanged
+        if self.processing_tab_built:
+            values.update(
+                concurrent_calls=self.concurrent_spin.value(),
+                pages_per_call=self.pages_per_call_spin.value(),
+                image_format=self.image_format_combo.currentData(),
+                save_images=self.save_images_check.isChecked(),
+                save_page_markdown=self.save_page_markdown_check.isChecked(),
+                target_max_dim=self.max_dim_spin.value(),
+            )
+        return values
+    
+    def show_help_topic(self, topic):
+        """Show the help text stored under topic, looked up when the button is clicked"""
+        self.show_help_message(self._s[f"{topic}_help_title"], self._s[f"{topic}_help"])
     
     def show_help_message(self, title, message):
-        """Display a help message dialog"""
-        QMessageBox.information(self, title, message)
+        """Display a help message dialog, built on first use"""
+        if self._help_box is None:
+            self._help_box = QMessageBox(QMessageBox.Information, "", "", QMessageBox.Ok, self)
+        self._help_box.setWindowTitle(title)
+        self._help_box.setText(message)
+        self._help_box.exec_()
     
     def load_settings(self):
         if not self.parent:
             return
         
-        # Load settings from parent
-        self.api_key_edit.setText(self.parent.api_key)
-        self.endpoint_edit.setText(self.parent.api_endpoint)
+        # Load settings from parent. Text setters reset the cursor and undo
+        # history even for the same text, so they only run on a change;
+        # setValue, setChecked and setCurrentIndex already ignore equal values
+        if self.api_key_edit.text() != self.parent.api_key:
+            self.api_key_edit.setText(self.parent.api_key)
+        if self.endpoint_edit.text() != self.parent.api_endpoint:
+            self.endpoint_edit.setText(self.parent.api_endpoint)
         
         # For editable combo box, directly set the text
-        self.model_combo.setCurrentText(self.parent.model_name)
+        if self.model_combo.currentText() != self.parent.model_name:
+            self.model_combo.setCurrentText(self.parent.model_name)
+        
+        # Set rate limits
+        self.rpm_spin.setValue(self.parent.requests_per_minute)
+        self.tpm_spin.setValue(self.parent.tokens_per_minute)
+        
+        if self.processing_tab_built:
+            self.load_processing_settings()
+    
+    def load_processing_settings(self):
+        if not self.parent:
+            return
         
         # Set processing values
         self.concurrent_spin.setValue(self.parent.concurrent_calls)
         self.pages_per_call_spin.setValue(self.parent.pages_per_call)
         
-        # Set API call interval
-        self.interval_spin.setValue(self.parent.api_call_interval)
-    
-    def tr(self, text):
-        """Simple translation helper function"""
-        # In a real app, this would use proper translation mechanisms
-        return text
\ No newline at end of file
+        # Set image format
+        format_index = self.image_format_combo.findData(self.parent.image_format)
+        self.image_format_combo.setCurrentIndex(max(0, format_index))
+        self.save_images_check.setChecked(self.parent.save_images)
+        self.save_page_markdown_check.setChecked(self.parent.save_page_markdown)
+        self.max_dim_spin.setValue(self.parent.target_max_dim)